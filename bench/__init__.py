@@ -0,0 +1,14 @@
+from polynom.ecc.bn254.scalar import Scalar as BN254_SCALAR
+from polynom.ecc import init_scalar_field
+
+init_scalar_field(BN254_SCALAR)
+
+from polynom.ecc import init_ecc
+from polynom.ecc.bn254.bn254 import BN254
+
+init_ecc(BN254)
+
+from polynom.polynomial import init_ntt_domain
+from polynom.ecc.bn254.domain import new_domain
+
+init_ntt_domain(new_domain)
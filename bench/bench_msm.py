@@ -0,0 +1,56 @@
+# python -m bench.bench_msm --min 8 --max 16 --native
+import argparse
+import time
+from polynom.ecc import Point, Scalar, init_ecc
+from polynom.ecc.bn254.native import BN254_NATIVE
+from polynom.ecc.msm import multiexp, window_size
+
+
+def naive(bases: list[Point], scalars: list[Scalar]) -> Point:
+    acc = Point.ZERO()
+    for base, e in zip(bases, scalars):
+        acc = acc + base * e
+    return acc
+
+
+def random_bases(n: int) -> list[Point]:
+    # cheaper than n random scalar multiplications
+    bases, acc, step = [], Point.rand(), Point.rand()
+    for _ in range(n):
+        bases.append(acc)
+        acc = acc + step
+    return bases
+
+
+def measure(f, *args):
+    t = time.perf_counter()
+    res = f(*args)
+    return res, time.perf_counter() - t
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--min", type=int, default=8)
+    parser.add_argument("--max", type=int, default=16)
+    parser.add_argument("--skip-naive", action="store_true")
+    parser.add_argument("--native", action="store_true")
+    args = parser.parse_args()
+    if args.native:
+        init_ecc(BN254_NATIVE)
+
+    print("log_n\twindow\tnaive(s)\tpippenger(s)\tspeedup")
+    for exp in range(args.min, args.max + 1):
+        n = 1 << exp
+        bases = random_bases(n)
+        scalars = [Scalar.rand() for _ in range(n)]
+        R1, t1 = measure(multiexp, bases, scalars)
+        if args.skip_naive:
+            print("{}\t{}\t-\t{:.3f}\t-".format(exp, window_size(n), t1))
+            continue
+        R0, t0 = measure(naive, bases, scalars)
+        assert R0 == R1
+        print("{}\t{}\t{:.3f}\t{:.3f}\t{:.1f}x".format(exp, window_size(n), t0, t1, t0 / t1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# python -m bench.bench_srs --exp 12 --workers 4 --out srs.bin
+import argparse
+import os
+import tempfile
+import time
+from polynom.ecc import Scalar
+from polynom.commitment.srs import SRS
+from polynom.commitment.srs_gen import generate_srs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--exp", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", type=str, default=None)
+    args = parser.parse_args()
+
+    n = 1 << args.exp
+    path = args.out or os.path.join(tempfile.mkdtemp(), "srs.bin")
+    t = time.perf_counter()
+    generate_srs(path, Scalar.rand(), n, args.workers)
+    elapsed = time.perf_counter() - t
+
+    srs = SRS.open(path)
+    assert srs.n() == n
+    print("log_n\tpoints/s\ttotal(s)\tfile")
+    print("{}\t{:.0f}\t{:.3f}\t{}".format(args.exp, n / elapsed, elapsed, path))
+
+
+if __name__ == "__main__":
+    main()
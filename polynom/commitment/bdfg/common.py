@@ -1,15 +1,14 @@
 from __future__ import annotations
 from polynom.ecc import Scalar
-from polynom.polynomial import Polynomial
+from polynom.polynomial import Polynomial, PointSet
 
 # https://eprint.iacr.org/2020/081.pdf
 
 
 def vanising_at(points: list[Scalar]):
-    acc = Polynomial.one()
-    for point in points:
-        acc = acc * Polynomial.degree_one(point)
-    return acc
+    if len(points) == 0:
+        return Polynomial.one()
+    return PointSet(list(points)).vanishing()
 
 
 class MultiBDFGCommon:
@@ -18,6 +17,9 @@ class MultiBDFGCommon:
 
         self.w = w
         self.shifts = shifts
+        # evaluation points are `z * w^shift` so the set of `w^shift`
+        # is built once and scaled for each `z`
+        self.point_set = PointSet([w**shift_val for shift_val in shifts])
 
     def opening_size(self) -> int:
 
@@ -29,11 +31,15 @@ class MultiBDFGCommon:
 
     def vanising(self, z) -> Polynomial:
 
-        acc = Polynomial.one()
+        # `∏(X - z * w^shift) = z^k * Z_S(X / z)`
+        k = self.opening_size()
+        return self.point_set.vanishing().distribute(z.inverse()).scale(z**k)
 
-        for z in self.eval_points(z):
-            acc = Polynomial.degree_one(z) * acc
-        return acc
+    def interpolate(self, evals: list[Scalar], z: Scalar) -> Polynomial:
+
+        # `r(X) = q(X / z)` where `q(w^shift) = r(z * w^shift)`
+        assert len(evals) == self.opening_size()
+        return self.point_set.interpolate(evals).distribute(z.inverse())
 
 
 class BatchBDFGCommon:
@@ -2,7 +2,7 @@ from __future__ import annotations
 from polynom.commitment.kzg_base import KZGProverBase
 from polynom.commitment.bdfg.common import BatchBDFGCommon, MultiBDFGCommon, vanising_at
 from polynom.ecc import Scalar, zero
-from polynom.polynomial import Polynomial, lagrange_interpolation
+from polynom.polynomial import Polynomial, powers_of
 from polynom.domain import Domain
 from polynom.lc import LinearCombination
 
@@ -15,16 +15,14 @@ class MultiBDFGProverKey(MultiBDFGCommon):
         self.domain = domain
         self.poly = poly
 
-    def evaluate(self, z) -> list[Scalar]:
+    def evaluate(self, z, powers: list[int] = None) -> list[Scalar]:
 
-        return [self.poly(e) for e in self.eval_points(z)]
+        evals = self.domain.evaluate_shifted(z, self.shifts, self.poly, powers=powers)
+        return [e for e, in evals]
 
     def low_degree_equivalent(self, z: Scalar) -> Polynomial:
 
-        eval_points = self.eval_points(z)
-        evals = self.evaluate(z)
-        points = [(x, y) for x, y in zip(eval_points, evals)]
-        return lagrange_interpolation(points)
+        return self.interpolate(self.evaluate(z), z)
 
     def linearision_polynomial(self, z: Scalar, x: Scalar) -> Polynomial:
 
@@ -41,8 +39,8 @@ class MultiBDFGProverKey(MultiBDFGCommon):
     def quotient_polynomial(self, z: Scalar) -> Polynomial:
 
         z_x = self.vanising(z)
-        r_x = self.low_degree_equivalent(z)
-        q_x = self.domain.div(self.poly - r_x, z_x)
+        # `f(X) - r(X)` and `f(X)` share the quotient
+        q_x, _ = self.poly.div_by_vanishing(self.eval_points(z))
         # sanity check
         assert q_x.degree() == self.poly.degree() - z_x.degree()
         return q_x
@@ -50,7 +48,7 @@ class MultiBDFGProverKey(MultiBDFGCommon):
     def linearized_quotient_polynomial(self, z: Scalar, x: Scalar) -> Polynomial:
 
         l_x = self.linearision_polynomial(z, x)
-        u_x = self.domain.div(l_x, Polynomial.degree_one(x))
+        u_x, _ = l_x.div_linear(x)
         # sanity check
         assert u_x.degree() + 1 == l_x.degree()
         return u_x
@@ -71,7 +69,9 @@ class BatchBDFGProverKey(BatchBDFGCommon):
 
     def evaluate(self, z: Scalar) -> list[list[Scalar]]:
 
-        return [opening.evaluate(z) for opening in self.openings]
+        # powers of `z` are shared by all openings
+        powers = powers_of(z, max(opening.poly.n() for opening in self.openings))
+        return [opening.evaluate(z, powers) for opening in self.openings]
 
     def inverse_vanishing(self, multi_open_index: int, z: Scalar) -> Polynomial:
 
@@ -107,7 +107,8 @@ class BatchBDFGProverKey(BatchBDFGCommon):
         # sanity check
         assert l_x(x) == zero
 
-        return self.domain.div(l_x, Polynomial.degree_one(x))
+        u_x, _ = l_x.div_linear(x)
+        return u_x
 
 
 class BDFGProver(KZGProverBase):
@@ -150,7 +151,7 @@ class BDFGProver(KZGProverBase):
         transcript = self.new_transcript()
 
         # commit to polynomials f_i(X) and write commitments to the transcript
-        [transcript.write_point(c) for c in self.c(*batch.polynomials())]
+        transcript.write_points(self.c(*batch.polynomials()))
 
         # get evaluation seed
         z = transcript.challenge()
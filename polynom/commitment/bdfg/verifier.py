@@ -1,19 +1,17 @@
 from __future__ import annotations
+from typing import Union
 from polynom.commitment.kzg_base import KZGVerifierBase
 from polynom.commitment.bdfg.common import BatchBDFGCommon, MultiBDFGCommon, vanising_at
-from polynom.ecc import Point, Scalar, pairing_check
+from polynom.ecc import Point, Scalar
 from polynom.lc import LinearCombination
-from polynom.polynomial import Polynomial, lagrange_interpolation
+from polynom.polynomial import Polynomial
 
 
 class MultiBDFGVerifierKey(MultiBDFGCommon):
 
     def low_degree_equivalent(self, evals: list[Scalar], z: Scalar):
 
-        eval_points = self.eval_points(z)
-        assert len(eval_points) == len(evals)
-        points = [(x, y) for x, y in zip(eval_points, evals)]
-        return lagrange_interpolation(points)
+        return self.interpolate(evals, z)
 
 
 class BatchBDFGVerifierKey(BatchBDFGCommon):
@@ -41,6 +39,19 @@ class BDFGVerifier(KZGVerifierBase):
 
     def verify_single(self, proof: bytes, key: MultiBDFGVerifierKey) -> bool:
 
+        return self.check(self.claim_single(proof, key))
+
+    def verifiy_batch(self, proof: bytes, key: BatchBDFGVerifierKey) -> bool:
+
+        return self.check(self.claim_batch(proof, key))
+
+    def verify_many(self, proofs: list[bytes], key: Union[MultiBDFGVerifierKey, BatchBDFGVerifierKey]) -> list[bool]:
+
+        claim = self.claim_single if isinstance(key, MultiBDFGVerifierKey) else self.claim_batch
+        return self.check_many([self.replay(claim, proof, key) for proof in proofs])
+
+    def claim_single(self, proof: bytes, key: MultiBDFGVerifierKey) -> tuple[Point, Point]:
+
         transcript = self.new_transcript(proof)
 
         # read the comitment
@@ -64,7 +75,7 @@ class BDFGVerifier(KZGVerifierBase):
         # where `f(set(z)) = r(set(z))`
         # then make a soft commitment to it `R = r(z) * G`
         r_x = key.low_degree_equivalent(evals, z)
-        R = self.G * r_x(x)
+        R = self.mul_G(r_x(x))
 
         # pairing check:
 
@@ -78,17 +89,15 @@ class BDFGVerifier(KZGVerifierBase):
         # calcualate the escape from G2 term `x * W'
         x_W_2 = W_2 * x
 
-        # finally apply the pairing
-        pairs = [(self.X_2, W_2), (self.n_G_2, x_W_2 + L)]
+        # pairing is applied by the caller
+        return W_2, x_W_2 + L
 
-        return pairing_check(pairs)
-
-    def verifiy_batch(self, proof: bytes, key: BatchBDFGVerifierKey) -> bool:
+    def claim_batch(self, proof: bytes, key: BatchBDFGVerifierKey) -> tuple[Point, Point]:
 
         transcript = self.new_transcript(proof)
 
         # read comitments
-        commitments = [transcript.read_point() for _ in range(key.opening_size())]
+        commitments = transcript.read_points(key.opening_size())
         # get evaluation seed
         z = transcript.challenge()
 
@@ -124,7 +133,7 @@ class BDFGVerifier(KZGVerifierBase):
         z_i_x = [key.inverse_vanishing(i, z) for i in range(key.opening_size())]
 
         # `Z'_i(x) * (com(f_i(X)) - r_i(x) * G)`
-        linearisation_contibs = [(commitments[i] - self.G * r_i_x[i](x)) * z_i_x[i](x) for i in range(key.opening_size())]
+        linearisation_contibs = [(commitments[i] - self.mul_G(r_i_x[i](x))) * z_i_x[i](x) for i in range(key.opening_size())]
         # combine linearisation
         L = alpha.combine_points(*linearisation_contibs)
 
@@ -135,7 +144,5 @@ class BDFGVerifier(KZGVerifierBase):
         # calcualate the escape from G2 term `Z_T(x) * W'
         x_W_2 = W_2 * x
 
-        # finally apply the pairing
-        pairs = [(self.X_2, W_2), (self.n_G_2, x_W_2 + L)]
-
-        return pairing_check(pairs)
\ No newline at end of file
+        # pairing is applied by the caller
+        return W_2, x_W_2 + L
\ No newline at end of file
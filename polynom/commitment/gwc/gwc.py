@@ -1,8 +1,7 @@
 from __future__ import annotations
 from polynom.commitment.kzg_base import KZGProverBase, KZGVerifierBase
-from polynom.ecc import Point, pairing_check
-from polynom.ecc import one
-from polynom.polynomial import Polynomial, evaluate
+from polynom.ecc import Point
+from polynom.polynomial import Polynomial, powers_of
 from polynom.lc import LinearCombination
 
 
@@ -47,15 +46,17 @@ class GWCProver(KZGProverBase):
 
         transcript = self.new_transcript()
 
-        [transcript.write_point(c) for c in self.c(*polys)]
+        transcript.write_points(self.c(*polys))
 
         z = transcript.challenge()
+        # powers of `z` are shared by all shifted evaluation points
+        z_powers = powers_of(z, max(poly.n() for poly in polys))
 
         for shift_val in key.shift_values():
 
-            eval_point = z * (self.domain.w()**shift_val)
+            eval_point = self.domain.shift(z, shift_val)
             polys_to_eval = [polys[i] for i in key.poly_indexes(shift_val)]
-            evals = evaluate(eval_point, *polys_to_eval)
+            evals = self.domain.evaluate_shifted(z, [shift_val], *polys_to_eval, powers=z_powers)[0]
 
             [transcript.write_scalar(e) for e in evals]
 
@@ -63,8 +64,7 @@ class GWCProver(KZGProverBase):
 
             polys_w_root = [poly - eval for eval, poly in zip(evals, polys_to_eval)]
             u_x = alpha.combine_poly(*polys_w_root)
-            root_z = Polynomial([-eval_point, one])
-            w_x = self.domain.div(u_x, root_z)
+            w_x, _ = u_x.div_linear(eval_point)
 
             W = self.commit(w_x)
             transcript.write_point(W)
@@ -76,12 +76,20 @@ class GWCVerifier(KZGVerifierBase):
 
     def verify(self, key: GWCKey, proof: bytes) -> bool:
 
+        return self.check(self.claim(key, proof))
+
+    def verify_many(self, key: GWCKey, proofs: list[bytes]) -> list[bool]:
+
+        return self.check_many([self.replay(self.claim, key, proof) for proof in proofs])
+
+    def claim(self, key: GWCKey, proof: bytes) -> tuple[Point, Point]:
+
         commitment_size = key.commitment_size()
         assert commitment_size > 0
 
         transcript = self.new_transcript(proof)
 
-        commitments = [transcript.read_point() for _ in range(commitment_size)]
+        commitments = transcript.read_points(commitment_size)
 
         z = transcript.challenge()
         witnesses, witnesses_mul_evals, combined_commitments, combined_evals = [], [], [], []
@@ -106,9 +114,7 @@ class GWCVerifier(KZGVerifierBase):
         W = multi_open_challenge.combine_points(*witnesses)
         z_W = multi_open_challenge.combine_points(*witnesses_mul_evals)
         combined_evals = multi_open_challenge.combine_fr(*combined_evals)
-        E = Point.G1(-combined_evals)
+        E = self.mul_G(-combined_evals)
         F = multi_open_challenge.combine_points(*combined_commitments)
 
-        pairs = [(self.X_2, W), (self.n_G_2, z_W + F + E)]
-
-        return pairing_check(pairs)
\ No newline at end of file
+        return W, z_W + F + E
\ No newline at end of file
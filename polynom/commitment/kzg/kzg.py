@@ -1,7 +1,6 @@
 from __future__ import annotations
 from polynom.commitment.kzg_base import KZGProverBase, KZGVerifierBase
-from polynom.ecc import Point, pairing_check
-from polynom.ecc import Scalar, one
+from polynom.ecc import Point
 from polynom.polynomial import Polynomial, evaluate
 from polynom.lc import LinearCombination
 
@@ -16,10 +15,8 @@ class KZGProver(KZGProverBase):
         transcript.write_point(P)
         z = transcript.challenge()
 
-        eval = P_x(z)
-        Q_x = P_x - eval
-        root_z = Polynomial([-z, Scalar(1)])
-        W_x = self.domain.div(Q_x, root_z)
+        # remainder of division by `X - z` is `P(z)`
+        W_x, eval = P_x.div_linear(z)
         transcript.write_scalar(eval)
 
         W = self.commit(W_x)
@@ -34,8 +31,7 @@ class KZGProver(KZGProverBase):
         transcript = self.new_transcript()
 
         commitments = self.c(*polys)
-        for c in commitments:
-            transcript.write_point(c)
+        transcript.write_points(commitments)
 
         z = transcript.challenge()
         alpha = LinearCombination(transcript.challenge())
@@ -46,8 +42,7 @@ class KZGProver(KZGProverBase):
 
         polys = [poly - eval for eval, poly in zip(evals, polys)]
         u_x = alpha.combine_poly(*polys)
-        root_z = Polynomial([-z, one])
-        w_x = self.domain.div(u_x, root_z)
+        w_x, _ = u_x.div_linear(z)
 
         W = self.commit(w_x)
         transcript.write_point(W)
@@ -58,6 +53,14 @@ class KZGVerifier(KZGVerifierBase):
 
     def verify(self, proof: bytes) -> bool:
 
+        return self.check(self.claim(proof))
+
+    def verify_many(self, proofs: list[bytes]) -> list[bool]:
+
+        return self.check_many([self.replay(self.claim, proof) for proof in proofs])
+
+    def claim(self, proof: bytes) -> tuple[Point, Point]:
+
         transcript = self.new_transcript(proof)
 
         F = transcript.read_point()
@@ -65,18 +68,24 @@ class KZGVerifier(KZGVerifierBase):
         eval = transcript.read_scalar()
         W = transcript.read_point()
 
-        E = Point.G1(-eval)
+        E = self.mul_G(-eval)
 
         zW = W * z
-        pairs = [(self.X_2, W), (self.n_G_2, zW + F + E)]
-
-        return pairing_check(pairs)
+        return W, zW + F + E
 
     def verify_batch(self, commitment_size: int, proof: bytes) -> bool:
 
+        return self.check(self.claim_batch(commitment_size, proof))
+
+    def verify_batch_many(self, commitment_size: int, proofs: list[bytes]) -> list[bool]:
+
+        return self.check_many([self.replay(self.claim_batch, commitment_size, proof) for proof in proofs])
+
+    def claim_batch(self, commitment_size: int, proof: bytes) -> tuple[Point, Point]:
+
         transcript = self.new_transcript(proof)
 
-        commitments = [transcript.read_point() for _ in range(commitment_size)]
+        commitments = transcript.read_points(commitment_size)
 
         z = transcript.challenge()
         alpha = LinearCombination(transcript.challenge())
@@ -84,11 +93,8 @@ class KZGVerifier(KZGVerifierBase):
         F = alpha.combine_points(*commitments)
         evals = [transcript.read_scalar() for _ in range(commitment_size)]
         e_combined = alpha.combine_fr(*evals)
-        E = Point.G1(-e_combined)
+        E = self.mul_G(-e_combined)
 
         W = transcript.read_point()
         z_W = W * z
-
-        pairs = [(self.X_2, W), (self.n_G_2, z_W + F + E)]
-
-        return pairing_check(pairs)
+        return W, z_W + F + E
@@ -1,22 +1,30 @@
 from __future__ import annotations
-from polynom.ecc import Point, Scalar
+import secrets
+from polynom.ecc import Point, Scalar, pairing_check
+from polynom.ecc.msm import multiexp
 from polynom.polynomial import Polynomial
-from polynom.domain import Domain
+from polynom.domain import Domain, Evaluations
+from typing import Callable, Optional, Union
 from polynom.proof_system.transcript.hasher import Hasher
 from polynom.proof_system.transcript.transcript import TranscriptRead, TranscriptWrite
 
-ZERO_POINT = Point.ZERO()
-
 
 class KZGProverBase():
 
-    def __init__(self, hasher: Hasher, bases: list[Point], inverse_bases: list[Point], domain: Domain):
+    def __init__(self, hasher: Hasher, bases: list[Point], inverse_bases: Union[list[Point], Callable[[], list[Point]]], domain: Domain):
 
         self.bases = bases
-        self.inverse_bases = inverse_bases
+        # lagrange bases may be given as a callable to be resolved on first use
+        self._inverse_bases = inverse_bases
         self.domain = domain
         self.hasher = hasher
 
+    @property
+    def inverse_bases(self) -> list[Point]:
+        if callable(self._inverse_bases):
+            self._inverse_bases = self._inverse_bases()
+        return self._inverse_bases
+
     def n(self):
 
         return len(self.bases)
@@ -25,21 +33,24 @@ class KZGProverBase():
 
         return [self.commit(p_x) for p_x in inputs]
 
-    def commit(self, p_x: Polynomial) -> Point:
+    def commit(self, p_x: Union[Polynomial, Evaluations]) -> Point:
 
+        if isinstance(p_x, Evaluations):
+            # evaluations over the setup domain are committed without interpolation
+            if not p_x.coset and p_x.domain.n == self.domain.n:
+                return self.commit_lagrange(p_x)
+            p_x = p_x.poly()
         assert self.n() >= p_x.n()
-        acc = ZERO_POINT
-        for i, a in enumerate(p_x.coeffs):
-            acc = acc + self.bases[i] * a
-        return acc
+        return multiexp(self.bases, p_x.coeffs)
 
-    def commit_lagrange(self, p_x: Polynomial) -> Point:
+    def commit_lagrange(self, p_x: Union[Polynomial, Evaluations]) -> Point:
 
+        if isinstance(p_x, Evaluations):
+            assert not p_x.coset
+            assert p_x.domain.n == self.domain.n
+            return multiexp(self.inverse_bases, p_x.evals)
         assert self.n() >= p_x.n()
-        acc = ZERO_POINT
-        for i, a in enumerate(p_x.coeffs):
-            acc = acc + self.inverse_bases[i] * a
-        return acc
+        return multiexp(self.inverse_bases, p_x.coeffs)
 
     def new_transcript(self) -> TranscriptWrite:
 
@@ -56,6 +67,54 @@ class KZGVerifierBase():
         self.n_G_2 = -Point.G2()
         self.w = w
 
+    def mul_G(self, s: Scalar) -> Point:
+        # `s * G` with the cached table of `G`
+        return self.G.mul_fixed(s)
+
+    def check(self, claim: tuple[Point, Point]) -> bool:
+        # every opening reduces to `e(A, X_2) * e(B, -G_2) = 1`
+        A, B = claim
+        return pairing_check([(self.X_2, A), (self.n_G_2, B)])
+
+    def replay(self, claim: Callable, *args) -> Optional[tuple[Point, Point]]:
+        # malformed proofs fail instead of aborting the whole batch
+        try:
+            return claim(*args)
+        except AssertionError:
+            return None
+
+    def check_combined(self, claims: list[tuple[Point, Point]]) -> bool:
+        if len(claims) == 1:
+            return self.check(claims[0])
+        # `∑ r_i * A_i` and `∑ r_i * B_i` with fresh 128 bit weights and `r_0 = 1`
+        weights = [Scalar(1)] + [Scalar(secrets.randbits(128)) for _ in range(len(claims) - 1)]
+        A = multiexp([A for A, _ in claims], weights)
+        B = multiexp([B for _, B in claims], weights)
+        return self.check((A, B))
+
+    def check_many(self, claims: list[Optional[tuple[Point, Point]]]) -> list[bool]:
+        results = [claim is not None for claim in claims]
+        self.bisect(claims, [i for i, claim in enumerate(claims) if claim is not None], results, False)
+        return results
+
+    def bisect(self, claims: list[tuple[Point, Point]], indexes: list[int], results: list[bool], failed: bool):
+        # `failed` is set when the combined check of `indexes` is already known to fail
+        if len(indexes) == 0:
+            return
+        if not failed and self.check_combined([claims[i] for i in indexes]):
+            return
+        if len(indexes) == 1:
+            results[indexes[0]] = False
+            return
+        mid = len(indexes) >> 1
+        left, right = indexes[:mid], indexes[mid:]
+        if self.check_combined([claims[i] for i in left]):
+            # then the failure is on the right
+            self.bisect(claims, right, results, True)
+        else:
+            self.bisect(claims, left, results, True)
+            self.bisect(claims, right, results, False)
+
     def new_transcript(self, proof: bytes) -> TranscriptRead:
 
         return TranscriptRead(self.hasher, proof)
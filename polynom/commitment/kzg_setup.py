@@ -1,4 +1,7 @@
 from __future__ import annotations
+import hashlib
+import os
+from typing import Optional
 from polynom.commitment.bdfg.prover import BDFGProver
 from polynom.commitment.bdfg.verifier import BDFGVerifier
 from polynom.commitment.gwc.gwc import GWCProver, GWCVerifier
@@ -6,14 +9,38 @@ from polynom.commitment.kzg import KZGProver, KZGVerifier
 from polynom.ecc import Point
 from polynom.ecc import Scalar
 from polynom.domain import Domain
+from polynom.commitment.srs import SRS, write_srs
+from polynom.commitment.srs_gen import generate_bases
 from polynom.proof_system.transcript.hasher import Hasher
 
-ZERO_POINT = Point.ZERO()
+
+# | count | sha256 of points | points |
+# | 8     | 32               | ...    |
+POINTS_HEADER_SIZE = 40
+
+
+def write_points(points: list[Point]) -> bytes:
+    data = b"".join(point.to_uncompressed() for point in Point.normalize_batch(points))
+    return len(points).to_bytes(8, "little") + hashlib.sha256(data).digest() + data
+
+
+def read_points(data: bytes, n: int) -> Optional[list[Point]]:
+    # `None` for files of wrong size, with a digest mismatch or with points that fail to decode
+    size = Point.G1().curve.uncompressed_point_size()
+    h = POINTS_HEADER_SIZE
+    if len(data) != h + n * size or int.from_bytes(data[:8], "little") != n:
+        return None
+    if hashlib.sha256(data[h:]).digest() != data[8:h]:
+        return None
+    try:
+        return [Point.from_uncompressed(data[h + i * size:h + (i + 1) * size]) for i in range(n)]
+    except (AssertionError, ValueError):
+        return None
 
 
 class KZGSetup:
 
-    def __init__(self, bases: list[Point], domain: Domain, X_2: Point, hasher: Hasher):
+    def __init__(self, bases: list[Point], domain: Domain, X_2: Point, hasher: Hasher, lagrange_cache_dir: str = None, inverse_bases: list[Point] = None):
         self.bases = bases
         self.domain = domain
         self.X_2 = X_2
@@ -21,34 +48,84 @@ class KZGSetup:
         self.nG2 = -Point.G2()
         self.hasher = hasher
 
-        self.inverse_bases = domain.ecc_interpolate(bases)
+        # lagrange bases are only computed when `commit_lagrange` needs them
+        # and kept in `lagrange_cache_dir` if given
+        self.lagrange_cache_dir = lagrange_cache_dir
+        self._inverse_bases = inverse_bases
+
+    @property
+    def inverse_bases(self) -> list[Point]:
+        if self._inverse_bases is None:
+            self._inverse_bases = self.load_lagrange_bases()
+        return self._inverse_bases
+
+    def lagrange_bases(self) -> list[Point]:
+        return self.inverse_bases
+
+    def lagrange_key(self) -> str:
+        # bases are powers of tau so `G` and `tau * G` fix the srs
+        h = hashlib.sha256()
+        h.update(self.bases[0].to_uncompressed())
+        h.update(self.bases[1].to_uncompressed() if len(self.bases) > 1 else b"")
+        h.update(self.domain.n.to_bytes(8, "little"))
+        h.update(self.domain.domain[1 % self.domain.n].n.to_bytes(32, "little"))
+        return h.hexdigest()[:32]
 
-    def new(domain: Domain, hasher: Hasher) -> KZGSetup:
+    def lagrange_path(self) -> str:
+        return os.path.join(self.lagrange_cache_dir, "lagrange_{}_{}.bin".format(self.domain.exp, self.lagrange_key()))
+
+    def load_lagrange_bases(self) -> list[Point]:
+        if self.lagrange_cache_dir is None:
+            return self.domain.ecc_interpolate(self.bases)
+
+        path = self.lagrange_path()
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                data = f.read()
+            inverse_bases = read_points(data, self.domain.n)
+            if inverse_bases is not None:
+                return inverse_bases
+
+        inverse_bases = self.domain.ecc_interpolate(self.bases)
+        os.makedirs(self.lagrange_cache_dir, exist_ok=True)
+        tmp = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp, "wb") as f:
+            f.write(write_points(inverse_bases))
+        os.replace(tmp, path)
+        return inverse_bases
+
+    def from_srs(srs: SRS, domain: Domain, hasher: Hasher, lagrange_cache_dir: str = None) -> KZGSetup:
+        # setup for `2^k` is a prefix view of a possibly larger srs
+        assert srs.n() >= domain.n
+        return KZGSetup(srs.bases[:domain.n], domain, srs.X_2, hasher, lagrange_cache_dir, srs.lagrange_bases(domain.n))
+
+    def load(path: str, domain: Domain, hasher: Hasher, lagrange_cache_dir: str = None) -> KZGSetup:
+        return KZGSetup.from_srs(SRS.open(path), domain, hasher, lagrange_cache_dir)
+
+    def save(self, path: str, lagrange: bool = False):
+        write_srs(path, self.bases, self.X_2, self.lagrange_bases() if lagrange else None)
+
+    def new(domain: Domain, hasher: Hasher, lagrange_cache_dir: str = None) -> KZGSetup:
         s = Scalar(0x0330fa29c0b79377aa26b9f89ad6c94912201b4c8a854c4fe1db0aae5d3e3139)
         # s = Scalar.rand()
-        n = domain.n
-        bases = [Point.G1()]
-        for i in range(n - 1):
-            base_previous = bases[i]
-            bases.append(base_previous * s)
-
+        bases = generate_bases(s, domain.n)
         sG = Point.G2(s)
-        return KZGSetup(bases, domain, sG, hasher)
+        return KZGSetup(bases, domain, sG, hasher, lagrange_cache_dir)
 
     def prover_kzg(self) -> KZGProver:
-        return KZGProver(self.hasher, self.bases, self.inverse_bases, self.domain)
+        return KZGProver(self.hasher, self.bases, self.lagrange_bases, self.domain)
 
     def verifier_kzg(self) -> KZGVerifier:
         return KZGVerifier(self.hasher, self.G_1, self.X_2, self.domain.w())
 
     def prover_gwc(self) -> GWCProver:
-        return GWCProver(self.hasher, self.bases, self.inverse_bases, self.domain)
+        return GWCProver(self.hasher, self.bases, self.lagrange_bases, self.domain)
 
     def verifier_gwc(self) -> GWCVerifier:
         return GWCVerifier(self.hasher, self.G_1, self.X_2, self.domain.w())
 
     def prover_bdfg(self) -> BDFGProver:
-        return BDFGProver(self.hasher, self.bases, self.inverse_bases, self.domain)
+        return BDFGProver(self.hasher, self.bases, self.lagrange_bases, self.domain)
 
     def verifier_bdfg(self) -> BDFGVerifier:
         return BDFGVerifier(self.hasher, self.G_1, self.X_2, self.domain.w())
@@ -0,0 +1,140 @@
+from __future__ import annotations
+import mmap
+import os
+import struct
+from typing import Iterator, Optional, Union
+from polynom.ecc import Point
+
+# binary srs layout, all integers little endian
+#
+# | magic | version | g1 size | g2 size | g1 count | lagrange count |
+# | 8     | 4       | 4       | 4       | 8        | 8              |
+#
+# followed by
+# - `tau * G2` as uncompressed g2 point
+# - `tau^i * G1` for `i < g1 count` as uncompressed affine g1 points
+# - `L_i(tau) * G1` for `i < lagrange count` if lagrange count is not zero
+#
+# fixed width points let any prefix of powers be addressed without decoding
+
+SRS_MAGIC = b"PLNMSRS\x00"
+SRS_VERSION = 1
+SRS_HEADER = struct.Struct("<8sIIIQQ")
+
+# number of points decoded at once when iterating
+SRS_CHUNK_SIZE = 1024
+
+
+class PointView:
+
+    def __init__(self, buffer, offset: int, size: int, count: int):
+
+        # `count` fixed width points at `offset` of a shared buffer
+        self.buffer = buffer
+        self.offset = offset
+        self.size = size
+        self.count = count
+        self.decoded: dict[int, Point] = {}
+
+    def decode(self, i: int) -> Point:
+        point = self.decoded.get(i)
+        if point is None:
+            start = self.offset + i * self.size
+            point = Point.from_uncompressed(self.buffer[start:start + self.size])
+            self.decoded[i] = point
+        return point
+
+    def prefix(self, count: int) -> PointView:
+        # shares the buffer, nothing is copied or decoded
+        assert count <= self.count
+        view = PointView(self.buffer, self.offset, self.size, count)
+        view.decoded = self.decoded
+        return view
+
+    def chunks(self, chunk_size: int = SRS_CHUNK_SIZE) -> Iterator[list[Point]]:
+        for start in range(0, self.count, chunk_size):
+            yield [self.decode(i) for i in range(start, min(start + chunk_size, self.count))]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Point]:
+        for chunk in self.chunks():
+            yield from chunk
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Point, PointView, list[Point]]:
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self.count)
+            if start == 0 and step == 1:
+                return self.prefix(stop)
+            return [self.decode(j) for j in range(start, stop, step)]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("point index out of range")
+        return self.decode(i)
+
+
+class SRS:
+
+    @staticmethod
+    def open(path: str) -> SRS:
+        with open(path, "rb") as f:
+            # an empty file cannot be mapped
+            if os.fstat(f.fileno()).st_size < SRS_HEADER.size:
+                raise ValueError("srs file is truncated")
+            # pages are shared between processes mapping the same file
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return SRS(buffer)
+
+    def __init__(self, buffer):
+
+        if len(buffer) < SRS_HEADER.size:
+            raise ValueError("srs file is truncated")
+        magic, version, g1_size, g2_size, g1_count, lagrange_count = SRS_HEADER.unpack_from(buffer, 0)
+        if magic != SRS_MAGIC or version != SRS_VERSION:
+            raise ValueError("not a srs file")
+        curve = Point.G1().curve
+        if g1_size != curve.uncompressed_point_size() or g2_size != curve.uncompressed_g2_point_size():
+            raise ValueError("srs point size mismatch")
+        if len(buffer) != SRS_HEADER.size + g2_size + (g1_count + lagrange_count) * g1_size:
+            raise ValueError("srs file is truncated")
+
+        self.buffer = buffer
+        offset = SRS_HEADER.size
+        self.X_2 = Point.from_uncompressed_g2(buffer[offset:offset + g2_size])
+        offset += g2_size
+        self.bases = PointView(buffer, offset, g1_size, g1_count)
+        offset += g1_count * g1_size
+        self.lagrange = PointView(buffer, offset, g1_size, lagrange_count) if lagrange_count else None
+
+    def n(self) -> int:
+        return len(self.bases)
+
+    def lagrange_bases(self, n: int) -> Optional[PointView]:
+        # lagrange bases are only valid for the domain they were computed over
+        if self.lagrange is None or len(self.lagrange) != n:
+            return None
+        return self.lagrange
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+
+def srs_header(g1_count: int, lagrange_count: int = 0) -> bytes:
+    curve = Point.G1().curve
+    return SRS_HEADER.pack(SRS_MAGIC, SRS_VERSION, curve.uncompressed_point_size(), curve.uncompressed_g2_point_size(), g1_count, lagrange_count)
+
+
+def write_srs(path: str, bases: list[Point], X_2: Point, lagrange: list[Point] = None):
+    lagrange = [] if lagrange is None else lagrange
+    tmp = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp, "wb") as f:
+        f.write(srs_header(len(bases), len(lagrange)))
+        f.write(X_2.to_uncompressed_g2())
+        for point in bases:
+            f.write(point.to_uncompressed())
+        for point in lagrange:
+            f.write(point.to_uncompressed())
+    os.replace(tmp, path)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from polynom.ecc import Point, Scalar, fixed_base_table
+from polynom.ecc.fixed_base import FIXED_BASE_WINDOW, FixedBaseTable
+from polynom.polynomial import powers_of
+from polynom.commitment.srs import srs_header
+
+# `tau^i` are computed in the scalar field first so that each base is
+# an independent fixed-base multiplication of the generator
+
+# points per job
+SRS_GEN_CHUNK_SIZE = 4096
+
+# worker state, the table is built once per process
+_TABLE: list = [None]
+
+
+def init_worker(curve, bits: int, c: int):
+    _TABLE[0] = FixedBaseTable(curve, curve.g1, bits, c)
+
+
+def encode_points(curve, points: list) -> bytes:
+    # the point at infinity has no affine form and is written as zeros
+    size = curve.uncompressed_point_size()
+    return b"".join(bytes(size) if curve.eq(point, curve.z1) else curve.to_uncompressed(point) for point in curve.normalize_batch(points))
+
+
+def _encode(powers: list[int]) -> bytes:
+    table = _TABLE[0]
+    return encode_points(table.curve, [table.mul(k) for k in powers])
+
+
+def generate_bases(tau: Scalar, n: int, c: int = FIXED_BASE_WINDOW) -> list[Point]:
+    # in process, for small setups
+    curve = Point.G1().curve
+    table = fixed_base_table(curve, curve.g1) if c == FIXED_BASE_WINDOW else FixedBaseTable(curve, curve.g1, Scalar.field_modulus.bit_length(), c)
+    return [Point(curve, table.mul(k)) for k in powers_of(tau, n)]
+
+
+def generate_srs(path: str, tau: Scalar, n: int, max_workers: int = None, executor: Executor = None, chunk_size: int = SRS_GEN_CHUNK_SIZE, c: int = FIXED_BASE_WINDOW, in_flight: int = None):
+    # at most `in_flight` chunks are submitted ahead of the one being written
+    curve = Point.G1().curve
+    if in_flight is None:
+        in_flight = 2 * (max_workers or os.cpu_count() or 1)
+    own = executor is None
+    if own:
+        executor = ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker, initargs=(curve, Scalar.field_modulus.bit_length(), c))
+
+    powers = powers_of(tau, n)
+    tmp = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        with open(tmp, "wb") as f:
+            f.write(srs_header(n))
+            f.write(Point.G2(tau).to_uncompressed_g2())
+            jobs = deque()
+            for i in range(0, n, chunk_size):
+                if len(jobs) >= in_flight:
+                    f.write(jobs.popleft().result())
+                jobs.append(executor.submit(_encode, powers[i:i + chunk_size]))
+            while jobs:
+                f.write(jobs.popleft().result())
+        os.replace(tmp, path)
+    finally:
+        if own:
+            executor.shutdown()
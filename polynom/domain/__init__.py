@@ -1 +1,2 @@
 from .domain import Domain
+from .evaluations import Evaluations
@@ -1,8 +1,11 @@
-from polynom.domain.fft import perform_fft
+from __future__ import annotations
+import copy
+import threading
+from polynom.domain.fft import bit_reverse_indices, fft_batch_in_place_int, fft_in_place, fft_scaled_in_place, twiddle_table
 from typing import Union
 from polynom.ecc import Point, Scalar, one, zero
 from polynom.utils import log2, pad_scalars, batch_inverse, pad_points
-from polynom.polynomial import Polynomial
+from polynom.polynomial import Polynomial, SparsePolynomial, evaluate_powers, powers_of
 
 
 def calculate_domain(w: Scalar, exp: int, k: int = 1) -> list[Scalar]:
@@ -15,11 +18,9 @@ def calculate_domain(w: Scalar, exp: int, k: int = 1) -> list[Scalar]:
 
 class Domain:
 
-    def __init__(self, root_of_unity: Scalar, s: int, exp: int, k: Scalar):
-
-        w = root_of_unity
-        w_inv = w.inverse()
+    def __init__(self, root_of_unity: Scalar, s: int, exp: int, k: Scalar, elements: list[Scalar] = None):
 
+        self.root_of_unity = root_of_unity
         self.exp = exp
         self.s = s
         self.inv_k = one / k
@@ -27,15 +28,123 @@ class Domain:
         self.n = 1 << exp
         self.inv_n = one / self.n
 
+        w = root_of_unity
         for _ in range(self.exp, self.s):
-            w, w_inv = w**2, w_inv**2
+            w = w**2
+
+        if elements is None:
+            self.domain = calculate_domain(w, self.exp, one)
+        else:
+            # precomputed elements i.e. strided from a larger domain
+            assert len(elements) == self.n
+            self.domain = elements
 
-        self.domain = calculate_domain(w, self.exp, one)
-        self.inverse_domain = calculate_domain(w_inv, self.exp, one)
+        # `w^-i = w^(n - i)`
+        self.inverse_domain = self.domain[:1] + self.domain[:0:-1]
 
+        w_inv = w.inverse()
         assert self.domain[1] == w
         assert self.inverse_domain[1] == w_inv
-        assert batch_inverse(self.domain) == self.inverse_domain
+
+        # shared by every transform over this domain
+        self.rev = bit_reverse_indices(self.exp)
+        self.twiddles = twiddle_table(self.domain)
+        self.inverse_twiddles = twiddle_table(self.inverse_domain)
+
+        # guards tables built on first use, domains are shared between threads
+        self.lock = threading.Lock()
+        # `k^i` and `k^-i / n` for coset transforms, built on first use
+        self.coset_powers = None
+        self.inverse_coset_powers = None
+        # inverses of distinct values of `Z_H` over extended cosets keyed by blowup
+        self.vanishing_inverses: dict[int, list[Scalar]] = {}
+        # set when the domain is served from a registry
+        self.registry = None
+        # integer twiddles for batched transforms, built on first use
+        self.int_twiddles = None
+        self.int_inverse_twiddles = None
+        # process pool backed transforms, see `with_parallel`
+        self.parallel = None
+        self.parallel_threshold = 0
+
+    def subdomain(self, exp: int) -> Domain:
+        assert exp <= self.exp
+        return Domain(self.root_of_unity, self.s, exp, self.k, self.domain[::1 << (self.exp - exp)])
+
+    def with_parallel(self, max_workers: int = None, threshold: int = 1 << 16, executor=None, max_blowup: int = 1) -> Domain:
+        # copy where scalar transforms of at least `threshold` elements run four-step fft on a process pool
+        # tables are shared and this domain, possibly served from a registry, is left as is
+        # workers hold tables of the extended domain for `max_blowup` and serve smaller domains by striding
+        from polynom.domain.parallel_fft import ParallelFFT
+        return self.sharing_parallel(ParallelFFT(self if max_blowup == 1 else self.extended(max_blowup), max_workers, executor), threshold)
+
+    def sharing_parallel(self, parallel, threshold: int) -> Domain:
+        domain = copy.copy(self)
+        domain.parallel = parallel
+        domain.parallel_threshold = threshold
+        return domain
+
+    def disable_parallel(self):
+        if self.parallel is not None:
+            self.parallel.close()
+        self.parallel = None
+
+    def use_parallel(self, A: list) -> bool:
+        return self.parallel is not None and self.n >= self.parallel_threshold and isinstance(A[0], Scalar)
+
+    def fft_in_place(self, A: list) -> list:
+        assert len(A) == self.n
+        if self.use_parallel(A):
+            A[:] = self.parallel.fft(A)
+            return A
+        return fft_in_place(A, self.twiddles, self.rev)
+
+    def ifft_in_place(self, A: list, scaled: bool = True) -> list:
+        # without `scaled` the result is `n` times the coefficients for callers folding `1 / n` elsewhere
+        assert len(A) == self.n
+        if self.use_parallel(A):
+            A[:] = self.parallel.fft(A, inverse=True, scale=self.inv_n.n if scaled else 1)
+            return A
+        fft_in_place(A, self.inverse_twiddles, self.rev)
+        if scaled:
+            for i in range(self.n):
+                A[i] = A[i] * self.inv_n
+        return A
+
+    def fft_batch(self, *input: Union[Polynomial, list[Scalar]]) -> list[Polynomial]:
+        # evaluations of many polynomials sharing twiddles per butterfly stage
+        return self.transform_batch(input, False)
+
+    def ifft_batch(self, *input: Union[Polynomial, list[Scalar]]) -> list[Polynomial]:
+        # coefficients of many polynomials sharing twiddles per butterfly stage
+        return self.transform_batch(input, True)
+
+    def prepare_int_twiddles(self):
+        # `int_inverse_twiddles` is published last so it marks both tables as ready
+        if self.int_inverse_twiddles is not None:
+            return
+        with self.lock:
+            if self.int_inverse_twiddles is not None:
+                return
+            int_twiddles = [[w.n for w in ws] for ws in self.twiddles]
+            int_inverse_twiddles = [[w.n for w in ws] for ws in self.inverse_twiddles]
+            self.int_twiddles = int_twiddles
+            self.int_inverse_twiddles = int_inverse_twiddles
+
+    def transform_batch(self, input: list[Union[Polynomial, list[Scalar]]], inverse: bool) -> list[Polynomial]:
+        self.prepare_int_twiddles()
+        p = Scalar.field_modulus
+        As = []
+        for poly in input:
+            coeffs = poly.coeffs if isinstance(poly, Polynomial) else poly
+            assert len(coeffs) <= self.n
+            As.append([c.n for c in coeffs] + [0] * (self.n - len(coeffs)))
+        if inverse:
+            fft_batch_in_place_int(As, self.int_inverse_twiddles, self.rev, p)
+            inv_n = self.inv_n.n
+            return [Polynomial([Scalar(e * inv_n) for e in A]) for A in As]
+        fft_batch_in_place_int(As, self.int_twiddles, self.rev, p)
+        return [Polynomial([Scalar(e) for e in A]) for A in As]
 
     def extend(self, poly: Polynomial):
         assert poly.n() <= self.n
@@ -50,57 +159,123 @@ class Domain:
     def coset(self, k):
         return [k * w for w in self.domain]
 
+    def prepare_coset(self):
+        # `inverse_coset_powers` is published last so it marks both tables as ready
+        if self.inverse_coset_powers is not None:
+            return
+        with self.lock:
+            if self.inverse_coset_powers is not None:
+                return
+            coset_powers = calculate_domain(self.k, self.exp, one)
+            inverse_coset_powers = calculate_domain(self.inv_k, self.exp, self.inv_n)
+            self.coset_powers = coset_powers
+            self.inverse_coset_powers = inverse_coset_powers
+
+    def coset_evaluate(self, poly: Union[Polynomial, list[Scalar]]) -> Polynomial:
+        # evaluations at `k * w^i`, coset shift is applied while padding
+        if isinstance(poly, Polynomial):
+            poly = poly.coeffs
+        assert len(poly) <= self.n
+        self.prepare_coset()
+        A = [c * u for c, u in zip(poly, self.coset_powers)] + [zero] * (self.n - len(poly))
+        return Polynomial(self.fft_in_place(A))
+
+    def coset_interpolate(self, evals: Union[Polynomial, list[Scalar]]) -> Polynomial:
+        # inverse of `coset_evaluate`, `1 / n` is folded into coset powers
+        if isinstance(evals, Polynomial):
+            evals = evals.coeffs
+        assert len(evals) <= self.n
+        self.prepare_coset()
+        A = self.ifft_in_place(pad_scalars(evals, self.n), scaled=False)
+        return Polynomial([c * u for c, u in zip(A, self.inverse_coset_powers)])
+
+    def extended(self, blowup: int) -> Domain:
+        # domain for low degree extensions `blowup` times larger
+        exp = self.exp + log2(blowup)
+        assert blowup == 1 << (exp - self.exp)
+        domain = self.registry.get(exp) if self.registry is not None else Domain(self.root_of_unity, self.s, exp, self.k)
+        if self.parallel is not None and exp <= self.parallel.domain.exp:
+            return domain.sharing_parallel(self.parallel, self.parallel_threshold)
+        return domain
+
+    def lde(self, poly: Polynomial, blowup: int) -> Polynomial:
+        # evaluations of `poly` over coset of the extended domain
+        assert poly.n() <= self.n
+        return self.extended(blowup).coset_evaluate(poly)
+
     def lagrange_polynomial(self, i: int) -> Polynomial:
+        # `L_i(X) = 1/n * ∑ (w^-i * X)^j`
         assert i < self.n
-        coeffs = [Scalar(0)] * self.n
-        coeffs[i] = one
-        return self.interpolate(Polynomial(coeffs))
+        coeffs = [self.inverse_domain[(i * j) % self.n] * self.inv_n for j in range(self.n)]
+        return Polynomial(coeffs)
 
-    def lagrange_evaluation_range(self, i: int, j: int, zeta: Scalar) -> Scalar:
-        pass
+    def lagrange_evaluation_range(self, i: int, j: int, zeta: Scalar) -> list[Scalar]:
+        # `L_m(zeta) = (zeta^n - 1) * w^m / (n * (zeta - w^m))` for `i <= m < j`
+        # with a single exponentiation and a single batch inversion
+        assert 0 <= i <= j <= self.n
+        zeta_n = zeta**self.n
+        if zeta_n == one:
+            # `zeta` is in the domain
+            return [one if self.domain[m] == zeta else zero for m in range(i, j)]
+        c = (zeta_n - one) * self.inv_n
+        inverses = batch_inverse([zeta - self.domain[m] for m in range(i, j)])
+        return [c * self.domain[m] * u for m, u in zip(range(i, j), inverses)]
 
     def lagrange_evaluation(self, i: int, zeta: Scalar) -> Scalar:
         assert i < self.n
-        n = self.n
-        zeta_n, w = zeta**n, self.domain[i]
-        u = (zeta_n - one) * w
-        v = (zeta - w) * n
-        return u / v
+        return self.lagrange_evaluation_range(i, i + 1, zeta)[0]
+
+    def evaluate_lagrange(self, evals: list[Scalar], zeta: Scalar) -> Scalar:
+        # barycentric evaluation of `∑ e_i * L_i(zeta)` without interpolation
+        assert len(evals) <= self.n
+        p = Scalar.field_modulus
+        basis = self.lagrange_evaluation_range(0, len(evals), zeta)
+        return Scalar(sum(e.n * u.n for e, u in zip(evals, basis)) % p)
 
     def new_poly(self, coeffs) -> Polynomial:
         assert len(coeffs) == self.n
         return Polynomial(coeffs)
 
     def i(self, *input: Union[Polynomial, list[Scalar]]) -> list[Polynomial]:
-        return [self.interpolate(poly) for poly in input]
+        return self.ifft_batch(*input)
 
     def interpolate(self, poly: Union[Polynomial, list[Scalar]]) -> Polynomial:
-        coeffs = None
         if isinstance(poly, Polynomial):
-            assert len(poly) <= self.n
-            coeffs = pad_scalars(poly.coeffs, self.n)
-            coeffs = [c * self.inv_n for c in perform_fft(coeffs, self.inverse_domain)]
-            return Polynomial(coeffs)
-
+            poly = poly.coeffs
         assert isinstance(poly, list)
-        coeffs = pad_scalars(poly, self.n)
-        coeffs = [c * self.inv_n for c in perform_fft(coeffs, self.inverse_domain)]
+        assert len(poly) <= self.n
+        coeffs = self.ifft_in_place(pad_scalars(poly, self.n))
         return Polynomial(coeffs)
 
     def evaluate(self, poly) -> Polynomial:
-        coeffs = pad_scalars(poly.coeffs, self.n)
-        coeffs = perform_fft(coeffs, self.domain)
+        coeffs = self.fft_in_place(pad_scalars(poly.coeffs, self.n))
         return Polynomial(coeffs)
 
     def ecc_evaluate(self, points: list[Point]) -> list[Point]:
         assert len(points) <= self.n
         points = pad_points(points, self.n)
-        perform_fft(points, self.domain)
+        return self.fft_in_place(points)
 
     def ecc_interpolate(self, points: list[Point]) -> list[Point]:
+        # `1 / n` is folded into last stage twiddles which saves `n / 2` scalar multiplications
         assert len(points) <= self.n
         points = pad_points(points, self.n)
-        return [c * self.inv_n for c in perform_fft(points, self.inverse_domain)]
+        scaled_last = [w * self.inv_n for w in self.inverse_twiddles[-1]]
+        return fft_scaled_in_place(points, self.inverse_twiddles, self.rev, self.inv_n, scaled_last)
+
+    def shift(self, z: Scalar, shift_val: int) -> Scalar:
+        return z * self.domain[shift_val % self.n]
+
+    def shifted_powers(self, powers: list[int], shift_val: int) -> list[int]:
+        # powers of `z * w^shift` from powers of `z`, `w^(shift * i)` is a table lookup
+        p, n = Scalar.field_modulus, self.n
+        return [u * self.domain[(shift_val * i) % n].n % p for i, u in enumerate(powers)]
+
+    def evaluate_shifted(self, z: Scalar, shifts: list[int], *inputs: Polynomial, powers: list[int] = None) -> list[list[Scalar]]:
+        # `evals[j][i] = inputs[i](z * w^shifts[j])`
+        if powers is None:
+            powers = powers_of(z, max([input.n() for input in inputs], default=0))
+        return [evaluate_powers(self.shifted_powers(powers, shift_val), *inputs, point=self.shift(z, shift_val)) for shift_val in shifts]
 
     def w(self) -> Scalar:
         return self.domain[1]
@@ -120,6 +295,29 @@ class Domain:
     def vanishing(self) -> Polynomial:
         return Polynomial([-one] + [zero] * (self.n - 1) + [one])
 
+    def vanishing_sparse(self) -> SparsePolynomial:
+        return SparsePolynomial([(0, -one), (self.n, one)])
+
+    def vanishing_coset_inverses(self, blowup: int) -> list[Scalar]:
+        # over the coset of extended domain `Z_H(k * w'^i) = k^n * w'^(i * n) - 1`
+        # and `w'^n` is a `blowup`th root of unity so there are only `blowup` distinct values
+        if blowup not in self.vanishing_inverses:
+            extended = self.extended(blowup)
+            k_n = self.k**self.n
+            values = [k_n * extended.domain[i * self.n] - one for i in range(blowup)]
+            assert zero not in values
+            self.vanishing_inverses[blowup] = batch_inverse(values)
+        return self.vanishing_inverses[blowup]
+
+    def divide_by_vanishing(self, poly: Union[Polynomial, list[Scalar]], blowup: int) -> Polynomial:
+        # quotient by `X^n - 1` of polynomial with degree below `blowup * n`
+        # a list input is taken as evaluations over the coset of extended domain
+        extended = self.extended(blowup)
+        evals = extended.coset_evaluate(poly).coeffs if isinstance(poly, Polynomial) else poly
+        assert len(evals) == extended.n
+        inverses = self.vanishing_coset_inverses(blowup)
+        return extended.coset_interpolate([e * inverses[i % blowup] for i, e in enumerate(evals)])
+
     def mul(self, *v: Polynomial) -> Polynomial:
         assert len(v) > 1
         for u in v:
@@ -127,12 +325,12 @@ class Domain:
             if u.is_zero():
                 return Polynomial([zero] * self.n)
 
-        acc = perform_fft(pad_scalars(v[0].coeffs, self.n), self.domain)
+        acc = self.fft_in_place(pad_scalars(v[0].coeffs, self.n))
         for i in range(1, len(v)):
-            v_i_evals = perform_fft(pad_scalars(v[i].coeffs, self.n), self.domain)
+            v_i_evals = self.fft_in_place(pad_scalars(v[i].coeffs, self.n))
             acc = [u * v for u, v in zip(acc, v_i_evals)]
 
-        coeffs = [c * self.inv_n for c in perform_fft(acc, self.inverse_domain)]
+        coeffs = self.ifft_in_place(acc)
 
         return self.new_poly(coeffs)
 
@@ -143,13 +341,13 @@ class Domain:
         assert a.n() <= self.n
         assert b.n() <= self.n
 
-        a_evals = perform_fft(pad_scalars(a.coeffs, self.n), self.domain)
-        b_evals = perform_fft(pad_scalars(b.coeffs, self.n), self.domain)
-        b_evals = [1 / u for u in b_evals]
+        a_evals = self.fft_in_place(pad_scalars(a.coeffs, self.n))
+        b_evals = self.fft_in_place(pad_scalars(b.coeffs, self.n))
+        b_evals = batch_inverse(b_evals)
 
         mul_evals = [u * v for u, v in zip(a_evals, b_evals)]
 
-        coeffs = [c * self.inv_n for c in perform_fft(mul_evals, self.inverse_domain)]
+        coeffs = self.ifft_in_place(mul_evals)
 
         return self.new_poly(coeffs)
 
@@ -157,5 +355,11 @@ class Domain:
 
         if a.is_zero():
             return a.clone()
-        u = self.div(self.distribute_zeta(a), self.distribute_zeta(b))
-        return self.distribute_zeta_inv(u)
+        if b.is_zero():
+            return Polynomial([zero] * self.n)
+        assert a.n() <= self.n
+        assert b.n() <= self.n
+
+        a_evals = self.coset_evaluate(a).coeffs
+        b_evals = batch_inverse(self.coset_evaluate(b).coeffs)
+        return self.coset_interpolate([u * v for u, v in zip(a_evals, b_evals)])
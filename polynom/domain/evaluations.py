@@ -0,0 +1,102 @@
+from __future__ import annotations
+from typing import Union
+from polynom.ecc import Scalar
+from polynom.polynomial import Polynomial
+from polynom.utils import batch_inverse
+from polynom.domain.domain import Domain
+
+
+class Evaluations:
+
+    @staticmethod
+    def from_poly(domain: Domain, poly: Polynomial, coset: bool = False) -> Evaluations:
+        evals = domain.coset_evaluate(poly) if coset else domain.evaluate(poly)
+        return Evaluations(domain, evals.coeffs, coset, poly)
+
+    def __init__(self, domain: Domain, evals: list[Scalar], coset: bool = False, poly: Polynomial = None):
+
+        # evaluations over `w^i` or over `k * w^i` if `coset` is set
+        assert len(evals) == domain.n
+        self.domain = domain
+        self.evals = evals
+        self.coset = coset
+        # coefficients are interpolated on demand
+        self._poly = poly
+
+    def n(self) -> int:
+        return len(self.evals)
+
+    def poly(self) -> Polynomial:
+        if self._poly is None:
+            self._poly = self.domain.coset_interpolate(self.evals) if self.coset else self.domain.interpolate(self.evals)
+        return self._poly
+
+    def evaluate(self, z: Scalar) -> Scalar:
+        if self._poly is not None:
+            return self._poly(z)
+        # `p(k * w^i)` are evaluations of `p(k * X)` over the domain
+        if self.coset:
+            z = z * self.domain.inv_k
+        return self.domain.evaluate_lagrange(self.evals, z)
+
+    def new(self, evals: list[Scalar]) -> Evaluations:
+        return Evaluations(self.domain, evals, self.coset)
+
+    def check(self, other: Evaluations):
+        assert self.domain.n == other.domain.n
+        assert self.coset == other.coset
+
+    def add(self, other: Union[Evaluations, Scalar]) -> Evaluations:
+        if isinstance(other, Evaluations):
+            self.check(other)
+            return self.new([u + v for u, v in zip(self.evals, other.evals)])
+        return self.new([u + other for u in self.evals])
+
+    def sub(self, other: Union[Evaluations, Scalar]) -> Evaluations:
+        if isinstance(other, Evaluations):
+            self.check(other)
+            return self.new([u - v for u, v in zip(self.evals, other.evals)])
+        return self.new([u - other for u in self.evals])
+
+    def mul(self, other: Evaluations) -> Evaluations:
+        self.check(other)
+        return self.new([u * v for u, v in zip(self.evals, other.evals)])
+
+    def scale(self, k: Scalar) -> Evaluations:
+        return self.new([u * k for u in self.evals])
+
+    def div(self, other: Evaluations) -> Evaluations:
+        self.check(other)
+        return self.new([u * v for u, v in zip(self.evals, batch_inverse(other.evals))])
+
+    def neg(self) -> Evaluations:
+        return self.new([-u for u in self.evals])
+
+    def __call__(self, z: Scalar) -> Scalar:
+        return self.evaluate(z)
+
+    def __eq__(self, other: Evaluations) -> bool:
+        return self.domain.n == other.domain.n and self.coset == other.coset and self.evals == other.evals
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __sub__(self, other):
+        return self.sub(other)
+
+    def __neg__(self):
+        return self.neg()
+
+    def __mul__(self, other):
+        if isinstance(other, Evaluations):
+            return self.mul(other)
+        return self.scale(other)
+
+    def __truediv__(self, other):
+        return self.div(other)
+
+    def __len__(self):
+        return self.n()
+
+    def __getitem__(self, i):
+        return self.evals[i]
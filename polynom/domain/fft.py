@@ -1,5 +1,109 @@
 from polynom.ecc import Scalar
-from polynom.utils import bit_reverse, log2
+from polynom.utils import log2
+
+
+def bit_reverse_indices(exp: int) -> list[int]:
+    n = 1 << exp
+    rev = [0] * n
+    for i in range(1, n):
+        rev[i] = (rev[i >> 1] >> 1) | ((i & 1) << (exp - 1))
+    return rev
+
+
+def twiddle_table(domain: list[Scalar]) -> list[list[Scalar]]:
+    # stage `s` of size `m = 2^s` uses `w^(j * n / m)` for `j < m / 2`
+    n = len(domain)
+    exp = log2(n)
+    assert n == 1 << exp
+    return [domain[::n >> s][:1 << (s - 1)] for s in range(1, exp + 1)]
+
+
+def fft_in_place(A: list, twiddles: list[list[Scalar]], rev: list[int]) -> list:
+    n = len(A)
+    assert n == len(rev)
+    assert n == 1 << len(twiddles)
+    _permute(A, rev)
+    for ws in twiddles:
+        _butterflies(A, ws)
+    return A
+
+
+def fft_scaled_in_place(A: list, twiddles: list[list[Scalar]], rev: list[int], scale: Scalar, scaled_last: list[Scalar]) -> list:
+    # `scale * fft(A)` where scaling is folded into the last stage
+    # `scaled_last` is the last stage twiddles multiplied by `scale`
+    n = len(A)
+    if n == 1:
+        A[0] = A[0] * scale
+        return A
+    assert n == len(rev)
+    assert n == 1 << len(twiddles)
+    _permute(A, rev)
+    for ws in twiddles[:-1]:
+        _butterflies(A, ws)
+    mm = len(scaled_last)
+    assert n == mm << 1
+    for j, w in enumerate(scaled_last):
+        t = A[j + mm] * w
+        u = A[j] * scale
+        A[j] = u + t
+        A[j + mm] = u - t
+    return A
+
+
+def _permute(A: list, rev: list[int]):
+    for i, r in enumerate(rev):
+        if i < r:
+            A[i], A[r] = A[r], A[i]
+
+
+def _butterflies(A: list, ws: list[Scalar]):
+    mm = len(ws)
+    m = mm << 1
+    for k in range(0, len(A), m):
+        for j, w in enumerate(ws):
+            t = A[k + j + mm] * w
+            u = A[k + j]
+            A[k + j] = u + t
+            A[k + j + mm] = u - t
+
+
+def fft_in_place_int(A: list[int], twiddles: list[list[int]], rev: list[int], p: int) -> list[int]:
+    n = len(A)
+    for i, r in enumerate(rev):
+        if i < r:
+            A[i], A[r] = A[r], A[i]
+    for ws in twiddles:
+        mm = len(ws)
+        m = mm << 1
+        for k in range(0, n, m):
+            for j, w in enumerate(ws):
+                t = A[k + j + mm] * w % p
+                u = A[k + j]
+                A[k + j] = (u + t) % p
+                A[k + j + mm] = (u - t) % p
+    return A
+
+
+def fft_batch_in_place_int(As: list[list[int]], twiddles: list[list[int]], rev: list[int], p: int) -> list[list[int]]:
+    # same transform over many inputs, twiddles are looked up once per butterfly position
+    n = len(rev)
+    for A in As:
+        assert len(A) == n
+        for i, r in enumerate(rev):
+            if i < r:
+                A[i], A[r] = A[r], A[i]
+    for ws in twiddles:
+        mm = len(ws)
+        m = mm << 1
+        for k in range(0, n, m):
+            for j, w in enumerate(ws):
+                lo, hi = k + j, k + j + mm
+                for A in As:
+                    t = A[hi] * w % p
+                    u = A[lo]
+                    A[lo] = (u + t) % p
+                    A[hi] = (u - t) % p
+    return As
 
 
 def perform_fft(A: list[Scalar], domain: list[Scalar]) -> list[Scalar]:
@@ -7,19 +111,4 @@ def perform_fft(A: list[Scalar], domain: list[Scalar]) -> list[Scalar]:
     exp = log2(n)
     assert n == len(domain)
     assert n == 1 << exp
-    A = bit_reverse(A, exp)
-    d = n >> 1
-    for s in range(1, exp + 1):
-        m = 1 << s
-        k = 0
-        while k < n:
-            mm = m >> 1
-            for j in range(mm):
-                w = domain[j * d]
-                t = A[k + j + mm] * w
-                u = A[k + j]
-                A[k + j] = u + t
-                A[k + j + mm] = u - t
-            k += m
-        d >>= 1
-    return A
+    return fft_in_place(A[:], twiddle_table(domain), bit_reverse_indices(exp))
@@ -0,0 +1,115 @@
+from __future__ import annotations
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from polynom.ecc import Scalar
+from polynom.domain.fft import bit_reverse_indices, fft_in_place_int
+
+# four-step (Bailey) fft for `n = n1 * n2` with `j = j1 + n1 * j2` and `k = k2 + n2 * k1`
+# 1. `n1` column transforms of size `n2` over `x[j1::n1]`
+# 2. multiplication of `Y[j1][k2]` by `w^(j1 * k2)`
+# 3. `n2` row transforms of size `n1` over `Y[:][k2]` written to `X[k2 + n2 * k1]`
+
+# worker state, shipped once by the pool initializer
+_TABLES: dict = {}
+
+
+def init_worker(p: int, twiddles: list[list[int]], inverse_twiddles: list[list[int]], domain: list[int], inverse_domain: list[int]):
+    _TABLES.clear()
+    _TABLES.update({"p": p, False: (twiddles, domain), True: (inverse_twiddles, inverse_domain), "rev": {}})
+
+
+def _rev(exp: int) -> list[int]:
+    rev = _TABLES["rev"].get(exp)
+    if rev is None:
+        rev = bit_reverse_indices(exp)
+        _TABLES["rev"][exp] = rev
+    return rev
+
+
+def _columns(inverse: bool, exp: int, stride: int, offset: int, columns: list[list[int]]) -> list[list[int]]:
+    # step 1 and 2 for columns `offset, offset + 1, ...`
+    # transforms of size `2^exp` use first `exp` stages of the full table
+    # and `w^(j1 * k2)` is `stride`th power of an element of the full domain
+    p = _TABLES["p"]
+    twiddles, domain = _TABLES[inverse]
+    n, rev = len(domain), _rev(exp)
+    res = []
+    for j1, column in enumerate(columns, offset):
+        fft_in_place_int(column, twiddles[:exp], rev, p)
+        if j1 != 0:
+            column = [e * domain[(j1 * k2 * stride) % n] % p for k2, e in enumerate(column)]
+        res.append(column)
+    return res
+
+
+def _rows(inverse: bool, exp: int, scale: int, rows: list[list[int]]) -> list[list[int]]:
+    # step 3, outputs are multiplied by `scale` i.e. `1 / n` for inverse transforms
+    p = _TABLES["p"]
+    twiddles, _ = _TABLES[inverse]
+    rev = _rev(exp)
+    rows = [fft_in_place_int(row, twiddles[:exp], rev, p) for row in rows]
+    if scale != 1:
+        rows = [[e * scale % p for e in row] for row in rows]
+    return rows
+
+
+def worker_tables(domain) -> tuple:
+    # `initargs` for `init_worker`, pass them when bringing an own executor
+    return (
+        Scalar.field_modulus,
+        [[w.n for w in ws] for ws in domain.twiddles],
+        [[w.n for w in ws] for ws in domain.inverse_twiddles],
+        [w.n for w in domain.domain],
+        [w.n for w in domain.inverse_domain],
+    )
+
+
+class ParallelFFT:
+
+    def __init__(self, domain, max_workers: int = None, executor: Executor = None, chunks_per_worker: int = 4):
+
+        self.domain = domain
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker, initargs=worker_tables(domain))
+        self.executor = executor
+        # sizes the chunks, pass `max_workers` along with an own executor
+        self.workers = max_workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+
+    def close(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def chunk(self, count: int) -> int:
+        return max(1, count // (self.workers * self.chunks_per_worker))
+
+    def fft(self, A: list[Scalar], inverse: bool = False, scale: int = 1) -> list[Scalar]:
+        # transforms over the domain or its subdomain of size `len(A)`
+        n = len(A)
+        exp = n.bit_length() - 1
+        assert n == 1 << exp
+        assert exp <= self.domain.exp
+        exp1 = exp >> 1
+        exp2 = exp - exp1
+        n1, n2 = 1 << exp1, 1 << exp2
+        x = [e.n for e in A]
+
+        stride = 1 << (self.domain.exp - exp)
+        step = self.chunk(n1)
+        jobs = [self.executor.submit(_columns, inverse, exp2, stride, j1, [x[j::n1] for j in range(j1, min(j1 + step, n1))]) for j1 in range(0, n1, step)]
+        Y = [row for job in jobs for row in job.result()]
+
+        step = self.chunk(n2)
+        jobs = [self.executor.submit(_rows, inverse, exp1, scale, [[Y[j1][k2] for j1 in range(n1)] for k2 in range(k, min(k + step, n2))]) for k in range(0, n2, step)]
+        X = [None] * n
+        k2 = 0
+        for job in jobs:
+            for row in job.result():
+                X[k2::n2] = [Scalar(e) for e in row]
+                k2 += 1
+        return X
@@ -0,0 +1,47 @@
+from __future__ import annotations
+import threading
+from polynom.ecc import Scalar
+from polynom.domain.domain import Domain
+
+
+class DomainRegistry:
+
+    def __init__(self, root_of_unity: Scalar, s: int, k: Scalar):
+
+        self.root_of_unity = root_of_unity
+        self.s = s
+        self.k = k
+        self.lock = threading.RLock()
+        self.largest: Domain = None
+        self.domains: dict[int, Domain] = {}
+
+    def get(self, exp: int) -> Domain:
+
+        assert 0 < exp <= self.s
+        with self.lock:
+            domain = self.domains.get(exp)
+            if domain is not None:
+                return domain
+            if self.largest is None or self.largest.exp < exp:
+                self.reserve(exp)
+                return self.largest
+            domain = self.largest.subdomain(exp)
+            domain.registry = self
+            self.domains[exp] = domain
+            return domain
+
+    def reserve(self, exp: int):
+
+        # builds the largest domain, smaller ones are derived from it on demand
+        with self.lock:
+            if self.largest is not None and self.largest.exp >= exp:
+                return
+            self.largest = Domain(self.root_of_unity, self.s, exp, self.k)
+            self.largest.registry = self
+            self.domains[exp] = self.largest
+
+    def clear(self):
+
+        with self.lock:
+            self.largest = None
+            self.domains = {}
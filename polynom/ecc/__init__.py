@@ -1,4 +1,7 @@
 from __future__ import annotations
+import threading
+from collections import OrderedDict
+from polynom.ecc.fixed_base import FixedBaseTable
 
 one: Scalar = None
 zero: Scalar = None
@@ -41,6 +44,28 @@ class Curve:
     def to_uncompressed(self, p: Point) -> bytes:
         pass
 
+    def normalize_batch(self, points: list) -> list:
+        pass
+
+    def from_compressed(self, input: bytes):
+        pass
+
+    def from_compressed_batch(self, input: bytes) -> list:
+        pass
+
+    def to_compressed(self, p: Point) -> bytes:
+        pass
+
+    @staticmethod
+    def uncompressed_g2_point_size() -> int:
+        pass
+
+    def from_uncompressed_g2(self, input: bytes):
+        pass
+
+    def to_uncompressed_g2(self, p: Point) -> bytes:
+        pass
+
     def scalar_from_bytes(self, input: bytes):
         pass
 
@@ -53,7 +78,14 @@ class PairingFriendlyCurve(Curve):
     def is_pairing_friendly(self) -> bool:
         return True
 
+    def multi_miller_loop(self, pairs: list[tuple[Point, Point]]):
+        pass
+
+    def final_exponentiation(self, f):
+        pass
+
     def pairing_check(self, pairs: list[tuple[Point, Point]]) -> bool:
+        # product of pairings with a single final exponentiation
         return self._pairing_check(pairs)
 
 
@@ -67,6 +99,30 @@ def pairing_check(pairs: list[tuple[Point, Point]]) -> bool:
     return CURVE.pairing_check(pairs)
 
 
+# fixed-base tables of g1 points keyed by curve and affine encoding
+# max number of fixed base tables kept, least recently used are dropped
+FIXED_BASE_TABLES_SIZE = 4
+FIXED_BASE_TABLES: OrderedDict = OrderedDict()
+FIXED_BASE_TABLES_LOCK = threading.Lock()
+
+
+def fixed_base_table(curve: Curve, point) -> FixedBaseTable:
+    # keyed on the curve type and affine coordinates, `point` is not infinity
+    key = (type(curve).__name__,) + tuple(int(c) for c in curve.normalize(point))
+    with FIXED_BASE_TABLES_LOCK:
+        table = FIXED_BASE_TABLES.get(key)
+        if table is not None:
+            FIXED_BASE_TABLES.move_to_end(key)
+            return table
+    # built outside the lock, concurrent builders produce equal tables
+    table = FixedBaseTable(curve, point, Scalar.field_modulus.bit_length())
+    with FIXED_BASE_TABLES_LOCK:
+        FIXED_BASE_TABLES[key] = table
+        if len(FIXED_BASE_TABLES) > FIXED_BASE_TABLES_SIZE:
+            FIXED_BASE_TABLES.popitem(last=False)
+    return table
+
+
 class Point():
 
     @staticmethod
@@ -82,7 +138,7 @@ class Point():
         p = Point(CURVE, CURVE.g1)
         if s is None:
             return p
-        return p * s
+        return p.mul_fixed(s)
 
     @staticmethod
     def G2(s: Scalar = one):
@@ -96,6 +152,27 @@ class Point():
     def from_uncompressed(input: bytes) -> Point:
         return Point(CURVE, CURVE.from_uncompressed(input))
 
+    @staticmethod
+    def normalize_batch(points: list[Point]) -> list[Point]:
+        # equal points in affine form sharing a single inversion
+        if len(points) == 0:
+            return []
+        curve = points[0].curve
+        return [Point(curve, point) for point in curve.normalize_batch([point.point for point in points])]
+
+    @staticmethod
+    def from_compressed(input: bytes) -> Point:
+        return Point(CURVE, CURVE.from_compressed(input))
+
+    @staticmethod
+    def from_compressed_batch(input: bytes) -> list[Point]:
+        # concatenated compressed points
+        return [Point(CURVE, point) for point in CURVE.from_compressed_batch(input)]
+
+    @staticmethod
+    def from_uncompressed_g2(input: bytes) -> Point:
+        return Point(CURVE, CURVE.from_uncompressed_g2(input))
+
     def __init__(self, curve, point):
         self.curve = curve
         self.point = point
@@ -107,6 +184,12 @@ class Point():
     def to_uncompressed(self) -> bytes:
         return self.curve.to_uncompressed(self.point)
 
+    def to_compressed(self) -> bytes:
+        return self.curve.to_compressed(self.point)
+
+    def to_uncompressed_g2(self) -> bytes:
+        return self.curve.to_uncompressed_g2(self.point)
+
     def __add__(self, other: Point) -> Point:
         point = self.curve.add(self.point, other.point)
         return self.new(point)
@@ -120,6 +203,13 @@ class Point():
         new_point = self.curve.mul(self.point, scalar.n)
         return Point(self.curve, new_point)
 
+    def mul_fixed(self, scalar: Scalar) -> Point:
+        # for g1 points that are multiplied repeatedly,
+        # first call builds the table and later calls are additions only
+        if self.curve.eq(self.point, self.curve.z1):
+            return self
+        return Point(self.curve, fixed_base_table(self.curve, self.point).mul(scalar.n))
+
     def __neg__(self) -> Point:
         new_point = self.curve.neg(self.point)
         return Point(self.curve, new_point)
@@ -135,4 +225,4 @@ class Point():
 
     def __repr__(self) -> str:
         x, y = self.normalize()
-        return str((hex(x.n), hex(y.n)))
+        return str((hex(int(x)), hex(int(y))))
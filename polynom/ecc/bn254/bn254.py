@@ -1,6 +1,128 @@
-from py_ecc.optimized_bn128 import pairing, add, multiply, G1, G2, Z1, Z2, FQ12, normalize, neg, eq, is_on_curve, b, b2, FQ
+from py_ecc.optimized_bn128 import add, double, multiply, G1, G2, Z1, Z2, FQ12, normalize, neg, eq, is_on_curve, is_inf, b, b2, FQ, FQ2, twist, final_exponentiate, field_modulus, curve_order
+from py_ecc.optimized_bn128.optimized_pairing import linefunc, cast_point_to_fq12, pseudo_binary_encoding
 from polynom.ecc.bn254.scalar import Scalar
 from polynom.ecc import PairingFriendlyCurve, Point
+from polynom.ecc.glv import GLV, lattice_basis
+from polynom.utils import batch_inverse_int
+
+
+def cube_root_of_unity(q: int) -> int:
+    # non trivial `x^3 = 1 mod q` for `q = 1 mod 3`
+    assert q % 3 == 1
+    g = 2
+    while pow(g, (q - 1) // 3, q) == 1:
+        g += 1
+    return pow(g, (q - 1) // 3, q)
+
+
+# `(x, y) -> (beta * x, y)` acts on g1 as multiplication by `lam`
+GLV_BETA = cube_root_of_unity(field_modulus)
+GLV_LAMBDA = cube_root_of_unity(curve_order)
+if not eq(multiply(G1, GLV_LAMBDA), (G1[0] * GLV_BETA, G1[1], G1[2])):
+    # the other root of `lam^2 + lam + 1` pairs with `beta`
+    GLV_LAMBDA = GLV_LAMBDA * GLV_LAMBDA % curve_order
+GLV_BASIS = lattice_basis(curve_order, GLV_LAMBDA)
+
+assert GLV_BETA != 1 and pow(GLV_BETA, 3, field_modulus) == 1
+assert (GLV_LAMBDA * GLV_LAMBDA + GLV_LAMBDA + 1) % curve_order == 0
+assert eq(multiply(G1, GLV_LAMBDA), (G1[0] * GLV_BETA, G1[1], G1[2]))
+for _a, _b in GLV_BASIS:
+    assert (_a + _b * GLV_LAMBDA) % curve_order == 0
+    assert max(abs(_a), abs(_b)).bit_length() <= (curve_order.bit_length() + 1) // 2 + 1
+
+
+# compressed g1 is little endian `x` with flags in the top bits of the last byte
+# which are free as `p < 2^254`, flags follow arkworks
+COMPRESSED_NEGATIVE = 0x80
+COMPRESSED_INFINITY = 0x40
+COMPRESSED_FLAGS = COMPRESSED_NEGATIVE | COMPRESSED_INFINITY
+# `p = 3 mod 4` so `sqrt(a) = a^((p + 1) / 4)` for squares
+assert field_modulus % 4 == 3
+SQRT_EXP = (field_modulus + 1) // 4
+
+
+def compress(x: int, y: int, inf: bool) -> bytes:
+    if inf:
+        return bytes(31) + bytes([COMPRESSED_INFINITY])
+    out = bytearray(x.to_bytes(32, "little"))
+    if y > field_modulus - y:
+        out[31] |= COMPRESSED_NEGATIVE
+    return bytes(out)
+
+
+def decompress(input: bytes) -> tuple:
+    # affine `(x, y)` as integers or `None` for the point at infinity
+    flags = input[31] & COMPRESSED_FLAGS
+    x = int.from_bytes(input[:32], "little") & ((1 << 254) - 1)
+    if flags & COMPRESSED_INFINITY:
+        assert flags == COMPRESSED_INFINITY and x == 0
+        return None
+    assert x < field_modulus
+    rhs = (x * x * x + 3) % field_modulus
+    y = pow(rhs, SQRT_EXP, field_modulus)
+    # a valid square root is also a proof that the point is on the curve
+    assert y * y % field_modulus == rhs
+    if (y > field_modulus - y) != bool(flags & COMPRESSED_NEGATIVE):
+        y = field_modulus - y
+    return x, y
+
+
+def endomorphism(P: tuple) -> tuple:
+    # also holds for projective `(X, Y, Z)` since `x = X / Z`
+    return (P[0] * GLV_BETA, P[1], P[2])
+
+
+G1_GLV = GLV(curve_order, GLV_BASIS, add, double, neg, endomorphism, Z1)
+
+
+def mul(P: tuple, n: int) -> tuple:
+    # glv with wnaf for g1, g2 is left to py_ecc
+    if type(P[0]) is FQ:
+        return G1_GLV.mul(P, n)
+    return multiply(P, n)
+
+
+def multi_miller_loop(pairs: list[tuple]) -> FQ12:
+    # same as py_ecc `miller_loop` but all pairs share
+    # squarings of the accumulator and the final division
+    prepared = []
+    for Q, P in pairs:
+        if not is_on_curve(Q, b2):
+            raise ValueError("Invalid input - point Q is not on the correct curve")
+        if not is_on_curve(P, b):
+            raise ValueError("Invalid input - point P is not on the correct curve")
+        if is_inf(Q) or is_inf(P):
+            continue
+        prepared.append((twist(Q), cast_point_to_fq12(P)))
+
+    f_num, f_den = FQ12.one(), FQ12.one()
+    R = [Q for Q, _ in prepared]
+    for v in pseudo_binary_encoding[63::-1]:
+        f_num = f_num * f_num
+        f_den = f_den * f_den
+        for i, (Q, P) in enumerate(prepared):
+            _n, _d = linefunc(R[i], R[i], P)
+            f_num, f_den = f_num * _n, f_den * _d
+            R[i] = double(R[i])
+            if v == 1:
+                _n, _d = linefunc(R[i], Q, P)
+                f_num, f_den = f_num * _n, f_den * _d
+                R[i] = add(R[i], Q)
+            elif v == -1:
+                nQ = neg(Q)
+                _n, _d = linefunc(R[i], nQ, P)
+                f_num, f_den = f_num * _n, f_den * _d
+                R[i] = add(R[i], nQ)
+
+    for i, (Q, P) in enumerate(prepared):
+        Q1 = (Q[0]**field_modulus, Q[1]**field_modulus, Q[2]**field_modulus)
+        nQ2 = (Q1[0]**field_modulus, -Q1[1]**field_modulus, Q1[2]**field_modulus)
+        _n1, _d1 = linefunc(R[i], Q1, P)
+        R[i] = add(R[i], Q1)
+        _n2, _d2 = linefunc(R[i], nQ2, P)
+        f_num, f_den = f_num * _n1 * _n2, f_den * _d1 * _d2
+
+    return f_num / f_den
 
 
 class bn254(PairingFriendlyCurve):
@@ -27,16 +149,70 @@ class bn254(PairingFriendlyCurve):
         u = u // 2
         x = int.from_bytes(input[:u], "little")
         y = int.from_bytes(input[u:u * 2], "little")
+        # `(0, 0)` is not on the curve and encodes the point at infinity
+        if x == 0 and y == 0:
+            return self.z1
         point = (FQ(x), FQ(y), FQ(1))
         assert self.is_on_curve_g1(point)
         return point
 
+    def affine(self, x: int, y: int):
+        return (FQ(x), FQ(y), FQ(1))
+
+    def normalize_batch(self, points: list) -> list:
+        # same points with `z = 1` for a single field inversion,
+        # infinity is kept as is
+        p = field_modulus
+        inverses = batch_inverse_int([int(P[2]) for P in points], p)
+        return [P if z == 0 else self.affine(int(P[0]) * z % p, int(P[1]) * z % p) for P, z in zip(points, inverses)]
+
+    def from_compressed(self, input: bytes):
+        assert len(input) >= self.compressed_point_size()
+        xy = decompress(input)
+        return self.z1 if xy is None else self.affine(*xy)
+
+    def from_compressed_batch(self, input: bytes) -> list:
+        u = self.compressed_point_size()
+        assert len(input) % u == 0
+        points = []
+        for offset in range(0, len(input), u):
+            xy = decompress(input[offset:offset + u])
+            points.append(self.z1 if xy is None else self.affine(*xy))
+        return points
+
+    def to_compressed(self, p) -> bytes:
+        x, y = self.normalize(p)
+        x, y = int(x), int(y)
+        # infinity normalizes to `(0, 0)` which is not on the curve
+        return compress(x, y, x == 0 and y == 0)
+
     def to_uncompressed(self, p: Point) -> bytes:
         normalized = normalize(p)
         x = normalized[0]
         y = normalized[1]
         return self.scalar_to_bytes(x) + self.scalar_to_bytes(y)
 
+    @staticmethod
+    def uncompressed_g2_point_size() -> int:
+        return 128
+
+    def from_uncompressed_g2(self, input: bytes):
+        # `x = x0 + x1 * u` and `y = y0 + y1 * u` as four field elements
+        u = self.uncompressed_g2_point_size()
+        assert len(input) >= u
+        c = [int.from_bytes(input[i:i + 32], "little") for i in range(0, u, 32)]
+        if not any(c):
+            return Z2
+        point = (FQ2(c[:2]), FQ2(c[2:]), FQ2.one())
+        assert is_on_curve(point, b2)
+        return point
+
+    def to_uncompressed_g2(self, p) -> bytes:
+        if is_inf(p):
+            return bytes(self.uncompressed_g2_point_size())
+        x, y = normalize(p)
+        return b"".join(c.to_bytes(32, "little") for c in (x.coeffs[0], x.coeffs[1], y.coeffs[0], y.coeffs[1]))
+
     def scalar_from_bytes(self, input: bytes):
         return Scalar.from_32(input)
 
@@ -45,7 +221,8 @@ class bn254(PairingFriendlyCurve):
 
     def __init__(self):
         self.add = add
-        self.mul = multiply
+        self.double = double
+        self.mul = mul
         self.neg = neg
         self.eq = eq
         self.normalize = normalize
@@ -55,13 +232,15 @@ class bn254(PairingFriendlyCurve):
         self.g2 = G2
         self.z2 = Z2
 
-    def _pairing_check(self, pairs) -> bool:
-        acc = FQ12.one()
-        # TODO: use multi miller look
-        for pair in pairs:
-            acc = acc * pairing(pair[0].point, pair[1].point)
+    def multi_miller_loop(self, pairs) -> FQ12:
+        return multi_miller_loop([(pair[0].point, pair[1].point) for pair in pairs])
 
-        return acc == FQ12.one()
+    def final_exponentiation(self, f: FQ12) -> FQ12:
+        return final_exponentiate(f)
+
+    def _pairing_check(self, pairs) -> bool:
+        f = self.multi_miller_loop(pairs)
+        return self.final_exponentiation(f) == FQ12.one()
 
     def is_on_curve_g1(self, p: Point) -> bool:
         return is_on_curve(p, b)
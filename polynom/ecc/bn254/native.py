@@ -0,0 +1,224 @@
+from __future__ import annotations
+from py_ecc.optimized_bn128 import add as add_fq, double as double_fq, multiply as multiply_fq, neg as neg_fq, eq as eq_fq, normalize as normalize_fq, FQ, field_modulus, curve_order as r
+from polynom.ecc.bn254.bn254 import bn254, multi_miller_loop, GLV_BASIS, GLV_BETA
+from polynom.ecc.glv import GLV
+from polynom.utils import batch_inverse_int
+
+# g1 points are `(X, Y, Z)` integer triples in jacobian coordinates
+# `x = X / Z^2` and `y = Y / Z^3` on `y^2 = x^3 + 3`, `Z = 0` is the point at infinity
+# reductions are deferred to products and output coordinates
+# g2 points stay as py_ecc `FQ2` tuples and are handled by py_ecc
+
+p = field_modulus
+B = 3
+
+Z1 = (1, 1, 0)
+G1 = (1, 2, 1)
+
+
+def is_int_point(P) -> bool:
+    return type(P[0]) is int
+
+
+def double(P: tuple) -> tuple:
+    if not is_int_point(P):
+        return double_fq(P)
+    # dbl-2009-l
+    X, Y, Z = P
+    if Z == 0 or Y == 0:
+        return Z1
+    A = X * X % p
+    B_ = Y * Y % p
+    C = B_ * B_ % p
+    D = 2 * ((X + B_)**2 - A - C) % p
+    E = 3 * A
+    X3 = (E * E - 2 * D) % p
+    Y3 = (E * (D - X3) - 8 * C) % p
+    Z3 = 2 * Y * Z % p
+    return (X3, Y3, Z3)
+
+
+def add_mixed(P: tuple, Q: tuple) -> tuple:
+    # madd-2007-bl, `Q` is affine with `Z = 1`
+    X1, Y1, Z1_ = P
+    X2, Y2, _ = Q
+    if Z1_ == 0:
+        return Q
+    Z1Z1 = Z1_ * Z1_ % p
+    U2 = X2 * Z1Z1 % p
+    S2 = Y2 * Z1_ * Z1Z1 % p
+    H = (U2 - X1) % p
+    r = 2 * (S2 - Y1) % p
+    if H == 0:
+        if r == 0:
+            return double(P)
+        return Z1
+    HH = H * H % p
+    I = 4 * HH % p
+    J = H * I % p
+    V = X1 * I % p
+    X3 = (r * r - J - 2 * V) % p
+    Y3 = (r * (V - X3) - 2 * Y1 * J) % p
+    Z3 = ((Z1_ + H)**2 - Z1Z1 - HH) % p
+    return (X3, Y3, Z3)
+
+
+def add(P: tuple, Q: tuple) -> tuple:
+    if not is_int_point(P):
+        return add_fq(P, Q)
+    # add-2007-bl
+    X1, Y1, Z1_ = P
+    X2, Y2, Z2 = Q
+    if Z1_ == 0:
+        return Q
+    if Z2 == 0:
+        return P
+    if Z2 == 1:
+        return add_mixed(P, Q)
+    if Z1_ == 1:
+        return add_mixed(Q, P)
+    Z1Z1 = Z1_ * Z1_ % p
+    Z2Z2 = Z2 * Z2 % p
+    U1 = X1 * Z2Z2 % p
+    U2 = X2 * Z1Z1 % p
+    S1 = Y1 * Z2 * Z2Z2 % p
+    S2 = Y2 * Z1_ * Z1Z1 % p
+    H = (U2 - U1) % p
+    r = 2 * (S2 - S1) % p
+    if H == 0:
+        if r == 0:
+            return double(P)
+        return Z1
+    I = 4 * H * H % p
+    J = H * I % p
+    V = U1 * I % p
+    X3 = (r * r - J - 2 * V) % p
+    Y3 = (r * (V - X3) - 2 * S1 * J) % p
+    Z3 = ((Z1_ + Z2)**2 - Z1Z1 - Z2Z2) * H % p
+    return (X3, Y3, Z3)
+
+
+def neg(P: tuple) -> tuple:
+    if not is_int_point(P):
+        return neg_fq(P)
+    X, Y, Z = P
+    return (X, -Y % p, Z)
+
+
+def endomorphism(P: tuple) -> tuple:
+    # `x = X / Z^2` so scaling `X` scales `x`
+    X, Y, Z = P
+    return (X * GLV_BETA % p, Y, Z)
+
+
+G1_GLV = GLV(r, GLV_BASIS, add, double, neg, endomorphism, Z1)
+
+
+def multiply(P: tuple, n: int) -> tuple:
+    if not is_int_point(P):
+        return multiply_fq(P, n)
+    if P[2] == 0:
+        return Z1
+    return G1_GLV.mul(P, n)
+
+
+def eq(P: tuple, Q: tuple) -> bool:
+    if not is_int_point(P):
+        return eq_fq(P, Q)
+    X1, Y1, Z1_ = P
+    X2, Y2, Z2 = Q
+    if Z1_ == 0 or Z2 == 0:
+        return Z1_ == Z2
+    Z1Z1, Z2Z2 = Z1_ * Z1_, Z2 * Z2
+    return (X1 * Z2Z2 - X2 * Z1Z1) % p == 0 and (Y1 * Z2 * Z2Z2 - Y2 * Z1_ * Z1Z1) % p == 0
+
+
+def normalize(P: tuple) -> tuple:
+    # affine `(x, y)`, infinity maps to `(0, 0)` as in py_ecc
+    if not is_int_point(P):
+        return normalize_fq(P)
+    X, Y, Z = P
+    if Z == 0:
+        return (0, 0)
+    if Z == 1:
+        return (X, Y)
+    zinv = pow(Z, -1, p)
+    zinv2 = zinv * zinv % p
+    return (X * zinv2 % p, Y * zinv2 * zinv % p)
+
+
+def is_on_curve(P: tuple) -> bool:
+    X, Y, Z = P
+    if Z == 0:
+        return True
+    Z2 = Z * Z % p
+    return (Y * Y - X * X * X - B * Z2 * Z2 * Z2) % p == 0
+
+
+def to_py_ecc(P: tuple) -> tuple:
+    x, y = normalize(P)
+    if P[2] == 0:
+        return (FQ(1), FQ(1), FQ(0))
+    return (FQ(x), FQ(y), FQ(1))
+
+
+def from_py_ecc(P: tuple) -> tuple:
+    if P[2] == FQ(0):
+        return Z1
+    x, y = normalize_fq(P)
+    return (x.n, y.n, 1)
+
+
+class bn254_native(bn254):
+
+    def __init__(self):
+        super().__init__()
+        self.add = add
+        self.double = double
+        self.mul = multiply
+        self.neg = neg
+        self.eq = eq
+        self.normalize = normalize
+        self.z1 = Z1
+        self.g1 = G1
+
+    def affine(self, x: int, y: int):
+        return (x, y, 1)
+
+    def normalize_batch(self, points: list) -> list:
+        # jacobian `x = X / Z^2` and `y = Y / Z^3`
+        inverses = batch_inverse_int([P[2] for P in points], p)
+        normalized = []
+        for (X, Y, Z), zinv in zip(points, inverses):
+            if Z == 0:
+                normalized.append(Z1)
+                continue
+            zinv2 = zinv * zinv % p
+            normalized.append((X * zinv2 % p, Y * zinv2 * zinv % p, 1))
+        return normalized
+
+    def from_uncompressed(self, input: bytes):
+        u = self.uncompressed_point_size()
+        assert len(input) >= u
+        u = u // 2
+        point = (int.from_bytes(input[:u], "little"), int.from_bytes(input[u:u * 2], "little"), 1)
+        if point[0] == 0 and point[1] == 0:
+            return Z1
+        assert point[0] < p and point[1] < p
+        assert is_on_curve(point)
+        return point
+
+    def to_uncompressed(self, P) -> bytes:
+        x, y = normalize(P)
+        u = self.uncompressed_point_size() // 2
+        return x.to_bytes(u, "little") + y.to_bytes(u, "little")
+
+    def multi_miller_loop(self, pairs):
+        # pairing arithmetic stays in py_ecc
+        return multi_miller_loop([(pair[0].point, to_py_ecc(pair[1].point)) for pair in pairs])
+
+    def is_on_curve_g1(self, P) -> bool:
+        return is_on_curve(P)
+
+
+BN254_NATIVE = bn254_native()
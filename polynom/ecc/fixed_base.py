@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+# window width in bits, a table takes `ceil(bits / c) * (2^c - 1)` points
+FIXED_BASE_WINDOW = 8
+
+
+class FixedBaseTable:
+
+    def __init__(self, curve, point, bits: int, c: int = FIXED_BASE_WINDOW):
+
+        # `table[j][d - 1] = d * 2^(c * j) * P` so that `k * P` is
+        # a sum of one entry per window and needs no doublings
+        self.curve = curve
+        self.bits = bits
+        self.c = c
+        self.mask = (1 << c) - 1
+        add, double = curve.add, curve.double
+        self.table = []
+        base = point
+        for _ in range(0, bits, c):
+            row = [base]
+            for _ in range(self.mask - 1):
+                row.append(add(row[-1], base))
+            self.table.append(row)
+            # `2^c * base` is double of `2^(c - 1) * base`
+            base = double(row[(1 << (c - 1)) - 1])
+
+    def mul(self, k: int):
+        assert k.bit_length() <= self.bits
+        add, c, mask = self.curve.add, self.c, self.mask
+        acc = None
+        for row in self.table:
+            d = k & mask
+            if d != 0:
+                acc = row[d - 1] if acc is None else add(acc, row[d - 1])
+            k >>= c
+            if k == 0:
+                break
+        return self.curve.z1 if acc is None else acc
+
+    def mul_many(self, scalars: list[int]) -> list:
+        return [self.mul(k) for k in scalars]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+from typing import Callable
+
+# width of the signed digits, tables hold `2^(w - 2)` odd multiples
+GLV_WINDOW = 5
+
+
+def wnaf(k: int, w: int) -> list[int]:
+    # little endian digits, non-zero digits are odd, `|d| < 2^(w - 1)`
+    # and any `w` consecutive digits have at most one non-zero
+    assert k >= 0
+    half, full = 1 << (w - 1), 1 << w
+    digits = []
+    while k > 0:
+        if k & 1:
+            d = k & (full - 1)
+            if d >= half:
+                d -= full
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+
+def round_div(a: int, b: int) -> int:
+    # nearest integer to `a / b` for `b > 0`
+    return (2 * a + b) // (2 * b)
+
+
+def lattice_basis(r: int, lam: int) -> tuple[tuple[int, int], tuple[int, int]]:
+    # short vectors `(a, b)` with `a + b * lam = 0 mod r` from the extended
+    # euclidean algorithm on `r` and `lam`, guide to ecc algorithm 3.74
+    r0, r1 = r, lam
+    t0, t1 = 0, 1
+    # stop at the first remainder below `sqrt(r)`
+    while r1 * r1 >= r:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        t0, t1 = t1, t0 - q * t1
+    # `r0` is the last remainder above `sqrt(r)`
+    q = r0 // r1
+    r2, t2 = r0 - q * r1, t0 - q * t1
+    v1 = (r1, -t1)
+    if r0 * r0 + t0 * t0 <= r2 * r2 + t2 * t2:
+        v2 = (r0, -t0)
+    else:
+        v2 = (r2, -t2)
+    return v1, v2
+
+
+def decompose(k: int, r: int, basis: tuple[tuple[int, int], tuple[int, int]]) -> tuple[int, int]:
+    # `k = k1 + k2 * lam mod r` with `|k1|, |k2| ~ sqrt(r)`
+    (a1, b1), (a2, b2) = basis
+    c1 = round_div(b2 * k, r)
+    c2 = round_div(-b1 * k, r)
+    return k - c1 * a1 - c2 * a2, -c1 * b1 - c2 * b2
+
+
+class GLV:
+
+    def __init__(self, r: int, basis: tuple, add: Callable, double: Callable, neg: Callable, endomorphism: Callable, zero, w: int = GLV_WINDOW):
+
+        # `endomorphism(P) = lam * P` for points of order `r`
+        self.r = r
+        self.basis = basis
+        self.add = add
+        self.double = double
+        self.neg = neg
+        self.endomorphism = endomorphism
+        self.zero = zero
+        self.w = w
+
+    def odd_multiples(self, P) -> list:
+        # `[P, 3P, 5P, ...]`
+        table = [P]
+        P2 = self.double(P)
+        for _ in range((1 << (self.w - 2)) - 1):
+            table.append(self.add(table[-1], P2))
+        return table
+
+    def mul(self, P, k: int):
+        k %= self.r
+        if k == 0:
+            return self.zero
+        k1, k2 = decompose(k, self.r, self.basis)
+
+        # halves share the doublings, negative halves negate their table
+        T1 = self.odd_multiples(P)
+        T2 = [self.endomorphism(t) for t in T1]
+        if k1 < 0:
+            k1, T1 = -k1, [self.neg(t) for t in T1]
+        if k2 < 0:
+            k2, T2 = -k2, [self.neg(t) for t in T2]
+        d1, d2 = wnaf(k1, self.w), wnaf(k2, self.w)
+        d1 += [0] * (len(d2) - len(d1))
+        d2 += [0] * (len(d1) - len(d2))
+
+        add, double, neg = self.add, self.double, self.neg
+        acc = None
+        for i in reversed(range(len(d1))):
+            if acc is not None:
+                acc = double(acc)
+            for d, T in ((d1[i], T1), (d2[i], T2)):
+                if d == 0:
+                    continue
+                t = T[d >> 1] if d > 0 else neg(T[-d >> 1])
+                acc = t if acc is None else add(acc, t)
+        return self.zero if acc is None else acc
@@ -0,0 +1,59 @@
+from __future__ import annotations
+from polynom.ecc import Point, Scalar
+
+
+def window_size(n: int) -> int:
+    # roughly ln(n) + 2, see pippenger's bucket method
+    if n < 32:
+        return 3
+    return (n.bit_length() * 69) // 100 + 2
+
+
+def multiexp(bases: list[Point], scalars: list[Scalar]) -> Point:
+    assert len(bases) >= len(scalars)
+    n = len(scalars)
+    if n == 0:
+        return Point.ZERO()
+
+    curve = bases[0].curve
+    add, double = curve.add, curve.double
+
+    # drop zero scalars early, they don't contribute to any bucket
+    terms = [(base.point, e.n) for base, e in zip(bases, scalars) if e.n != 0]
+    if len(terms) == 0:
+        return Point(curve, curve.z1)
+
+    num_bits = max(k.bit_length() for _, k in terms)
+    c = window_size(len(terms))
+    mask = (1 << c) - 1
+
+    # `None` stands for the point at infinity to skip trivial additions
+    acc = None
+    for offset in reversed(range(0, num_bits, c)):
+
+        if acc is not None:
+            for _ in range(c):
+                acc = double(acc)
+
+        buckets = [None] * mask
+        for point, k in terms:
+            d = (k >> offset) & mask
+            if d == 0:
+                continue
+            bucket = buckets[d - 1]
+            buckets[d - 1] = point if bucket is None else add(bucket, point)
+
+        # ∑ d * bucket_d with running sums
+        running, window = None, None
+        for bucket in reversed(buckets):
+            if bucket is not None:
+                running = bucket if running is None else add(running, bucket)
+            if running is not None:
+                window = running if window is None else add(window, running)
+
+        if window is not None:
+            acc = window if acc is None else add(acc, window)
+
+    if acc is None:
+        return Point(curve, curve.z1)
+    return Point(curve, acc)
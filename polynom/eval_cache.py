@@ -0,0 +1,81 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Callable, Optional
+
+# max number of evaluations kept per polynomial, zero disables caching
+EVAL_CACHE_SIZE: int = 64
+
+
+class CacheStats:
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return str({"hits": self.hits, "misses": self.misses, "evictions": self.evictions})
+
+
+# aggregated over all caches of the process
+STATS = CacheStats()
+
+
+class EvaluationCache:
+
+    def __init__(self, size: int):
+        assert size > 0
+        self.size = size
+        self.entries = OrderedDict()
+        self.stats = CacheStats()
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.stats.misses += 1
+            STATS.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats.hits += 1
+        STATS.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+            self.stats.evictions += 1
+            STATS.evictions += 1
+
+    def invalidate(self):
+        self.entries.clear()
+
+    def copy(self) -> EvaluationCache:
+        cache = new_eval_cache()
+        if cache is not None:
+            for key, value in self.entries.items():
+                cache.put(key, value)
+        return cache
+
+    def __len__(self):
+        return len(self.entries)
+
+
+EVAL_CACHE: Callable[[int], EvaluationCache] = EvaluationCache
+
+
+def init_eval_cache(size: int = EVAL_CACHE_SIZE, cache: Callable[[int], EvaluationCache] = EvaluationCache):
+    global EVAL_CACHE_SIZE
+    EVAL_CACHE_SIZE = size
+    global EVAL_CACHE
+    EVAL_CACHE = cache
+
+
+def new_eval_cache() -> Optional[EvaluationCache]:
+    if EVAL_CACHE_SIZE <= 0:
+        return None
+    return EVAL_CACHE(EVAL_CACHE_SIZE)
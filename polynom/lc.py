@@ -2,8 +2,6 @@ from polynom.ecc  import Scalar, zero, one
 from polynom.ecc import Point
 from polynom.polynomial import Polynomial
 
-ZERO_POINT = Point.ZERO()
-
 
 class LinearCombination:
 
@@ -26,27 +24,27 @@ class LinearCombination:
 
     def combine_points_for_degree(self, degree: int, *input: tuple[Point, Scalar]) -> Point:
         assert len(input) > 0
-        e, acc = self.e**degree, ZERO_POINT
+        e, acc = self.e**degree, Point.ZERO()
         for (point, scalar) in input:
             acc = acc + point * (scalar * e)
         return acc
 
     def multiexp_with_aux(self, degree: int, *input: tuple[Point, Scalar]) -> Point:
         assert len(input) > 0
-        e, acc = self.e**degree, ZERO_POINT
+        e, acc = self.e**degree, Point.ZERO()
         for (point, scalar) in input:
             acc = acc + point * (scalar * e)
         return acc
 
     def combine_points(self, *points: Point) -> Point:
-        acc, e = ZERO_POINT, one
+        acc, e = Point.ZERO(), one
         for point in points:
             acc = acc + point * e
             e = e * self.e
         return acc
 
     def combine_ecc_with_aux(self, *inputs: tuple[Point, Scalar]) -> tuple[Point, Point]:
-        accW, accR, e = ZERO_POINT, ZERO_POINT, one
+        accW, accR, e = Point.ZERO(), Point.ZERO(), one
         for (point, zeta) in inputs:
             accW = accW + point * e
             accR = accR + point * (e * zeta)
@@ -1,37 +1,126 @@
 from __future__ import annotations
-from typing import Tuple
+from typing import Callable, Tuple
 from polynom.ecc import Scalar, zero, one
-from polynom.utils import pad_scalars, trim_zeros
+from polynom.eval_cache import new_eval_cache
+from polynom.utils import batch_inverse, log2, pad_scalars, trim_zeros
+
+# operands up to `MUL_KARATSUBA_THRESHOLD` long are multiplied with schoolbook method
+# when both operands are at least `MUL_NTT_THRESHOLD` long product is computed over an fft domain
+MUL_KARATSUBA_THRESHOLD = 16
+MUL_NTT_THRESHOLD = 4096
+# divisions with both quotient and divisor longer than this use newton iteration
+DIV_NEWTON_THRESHOLD = 64
+# multipoint evaluation switches to subproduct tree above this many points
+EVAL_TREE_THRESHOLD = 32
+
+NTT_DOMAIN: Callable = None
+
+
+def init_ntt_domain(new_domain: Callable):
+    global NTT_DOMAIN
+    NTT_DOMAIN = new_domain
+
+
+def _mul_schoolbook(a: list[int], b: list[int]) -> list[int]:
+    c = [0] * (len(a) + len(b) - 1)
+    for i, u in enumerate(a):
+        if u == 0:
+            continue
+        for j, v in enumerate(b):
+            c[i + j] += u * v
+    return c
+
+
+def _mul_karatsuba(a: list[int], b: list[int]) -> list[int]:
+    # works over integers and reduction is left to the caller
+    if len(a) < len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    if m <= MUL_KARATSUBA_THRESHOLD:
+        return _mul_schoolbook(a, b)
+
+    k = n >> 1
+    c = [0] * (n + m - 1)
+    a0, a1 = a[:k], a[k:]
+    if m <= k:
+        # unbalanced, split only the longer operand
+        for i, e in enumerate(_mul_karatsuba(a0, b)):
+            c[i] += e
+        for i, e in enumerate(_mul_karatsuba(a1, b)):
+            c[i + k] += e
+        return c
+
+    b0, b1 = b[:k], b[k:]
+    z0 = _mul_karatsuba(a0, b0)
+    z2 = _mul_karatsuba(a1, b1)
+    a01 = [u + v for u, v in zip(a0, a1)] + a1[len(a0):]
+    b01 = [u + v for u, v in zip(b0, b1)] + b0[len(b1):] + b1[len(b0):]
+    z1 = _mul_karatsuba(a01, b01)
+    for i, e in enumerate(z0):
+        c[i] += e
+        z1[i] -= e
+    for i, e in enumerate(z2):
+        c[i + 2 * k] += e
+        z1[i] -= e
+    for i, e in enumerate(z1):
+        c[i + k] += e
+    return c
+
+
+def powers_of(x: Scalar, n: int) -> list[int]:
+    # `[1, x, x^2, ..., x^(n-1)]` as reduced integers
+    p, x = Scalar.field_modulus, x.n
+    acc, powers = 1, []
+    for _ in range(n):
+        powers.append(acc)
+        acc = acc * x % p
+    return powers
+
+
+def evaluate_powers(powers: list[int], *inputs: Polynomial, point: Scalar = None) -> list[Scalar]:
+    # dot products with a single reduction per polynomial
+    # results are cached in polynomials if `point` is given
+    p = Scalar.field_modulus
+    evals = []
+    for input in inputs:
+        assert len(powers) >= input.n()
+        e = Scalar(sum(c.n * u for c, u in zip(input.coeffs, powers)) % p)
+        if point is not None and input.cache is not None:
+            input.cache.put(point.n, e)
+        evals.append(e)
+    return evals
+
+
+def evaluate_many(points: list[Scalar], *inputs: Polynomial) -> list[list[Scalar]]:
+    # `evals[j][i] = inputs[i](points[j])`
+    # cached evaluations are reused and powers are computed only for misses
+    evals = []
+    for point in points:
+        cached = [None if input.cache is None else input.cache.get(point.n) for input in inputs]
+        missing = [input for input, e in zip(inputs, cached) if e is None]
+        if len(missing) > 0:
+            n = max(input.n() for input in missing)
+            computed = iter(evaluate_powers(powers_of(point, n), *missing, point=point))
+            cached = [next(computed) if e is None else e for e in cached]
+        evals.append(cached)
+    return evals
 
 
 def evaluate(point: Scalar, *inputs: Polynomial) -> list[Scalar]:
-    return [input(point) for input in inputs]
+    return evaluate_many([point], *inputs)[0]
 
 
 def lagrange_interpolation(xy: list[Tuple(Scalar, Scalar)]) -> Polynomial:
 
-    L_x = Polynomial.zero()
-    size = len(xy)
-    for i in range(size):
-        l_x = Polynomial.one()
-        denom = Scalar(1)
-        x_i, y_i = xy[i]
-        for j in range(size):
-            x_j, _ = xy[j]
-            if j == i:
-                continue
-            contrib = Polynomial.degree_one(x_j)
-            l_x = l_x * contrib
-            denom = denom * (x_i - x_j)
-        l_x = l_x * (y_i / denom)
-        L_x = L_x + l_x
-
-    return L_x
+    if len(xy) == 0:
+        return Polynomial.zero()
+    point_set = PointSet([x for x, _ in xy])
+    return point_set.interpolate([y for _, y in xy])
 
 
 def barycentric_preprocess(points: list[Scalar]) -> list[tuple[Scalar, Scalar]]:
 
-    weights = []
+    denoms = []
     size = len(points)
     for i in range(size):
         acc = one
@@ -44,16 +133,15 @@ def barycentric_preprocess(points: list[Scalar]) -> list[tuple[Scalar, Scalar]]:
             # expect distinct points
             assert dif != zero
             acc = acc * dif
-        # one can apply batch inversion to make it more effective
-        weights.append((x_i, one / acc))
-    return weights
+        denoms.append(acc)
+    return list(zip(points, batch_inverse(denoms)))
 
 
 def barycentric_evaluation(weights: list[tuple[Scalar, Scalar]], evaluations: list[Scalar], z: Scalar):
     size = len(evaluations)
     assert len(weights) == size
-    # one can apply batch inversion to make it more effective
-    denom_coeffs = [weights[i][1] * (one / (z - weights[i][0])) for i in range(size)]
+    inv_difs = batch_inverse([z - x_i for x_i, _ in weights])
+    denom_coeffs = [w_i * u for (_, w_i), u in zip(weights, inv_difs)]
     num_coeffs = [coeff * e for coeff, e in zip(denom_coeffs, evaluations)]
     return sum(num_coeffs) / sum(denom_coeffs)
 
@@ -88,8 +176,28 @@ class Polynomial:
 
     def __init__(self, coeffs: list[Scalar]):
 
+        self.cache = new_eval_cache()
         self.coeffs = coeffs
-        self.evals = {}
+
+    @property
+    def coeffs(self) -> list[Scalar]:
+        return self._coeffs
+
+    @coeffs.setter
+    def coeffs(self, coeffs: list[Scalar]):
+        self._coeffs = coeffs
+        self.invalidate()
+
+    def invalidate(self):
+        # must be called after coefficients are mutated in place
+        if self.cache is not None:
+            self.cache.invalidate()
+
+    def with_cache_of(self, other: Polynomial) -> Polynomial:
+        # for results that are the same function as `other`
+        if other.cache is not None and self.cache is not None:
+            self.cache = other.cache.copy()
+        return self
 
     def __call__(self, z) -> Scalar:
         eval = self.evaluate(z)
@@ -115,18 +223,18 @@ class Polynomial:
         return self
 
     def clone(self) -> Polynomial:
-        return Polynomial(self.coeffs[:])
+        return Polynomial(self.coeffs[:]).with_cache_of(self)
 
     def pad(self, n):
         coeffs = pad_scalars(self.coeffs, n)
-        return Polynomial(coeffs)
+        return Polynomial(coeffs).with_cache_of(self)
 
     def eq(self, other) -> bool:
-        a = self.trim_zeros()
-        b = other.trim_zeros()
-        if a.n() != b.n():
+        a = trim_zeros(self.coeffs)
+        b = trim_zeros(other.coeffs)
+        if len(a) != len(b):
             return False
-        for ai, bi in zip(a.coeffs, b.coeffs):
+        for ai, bi in zip(a, b):
             if ai != bi:
                 return False
         return True
@@ -153,15 +261,20 @@ class Polynomial:
         return Polynomial(trim_zeros(self.coeffs))
 
     def evaluate(self, x: Scalar) -> Scalar:
-        if x.n in self.evals:
-            return self.evals[x.n]
+        if self.cache is not None:
+            acc = self.cache.get(x.n)
+            if acc is not None:
+                return acc
         acc = x.zero()
         for a in reversed(self.coeffs):
             acc = x * acc + a
-        self.evals[x.n] = acc
+        if self.cache is not None:
+            self.cache.put(x.n, acc)
         return acc
 
     def evaluate_multi(self, xs: list[Scalar]) -> Polynomial:
+        if len(xs) > EVAL_TREE_THRESHOLD and self.n() > EVAL_TREE_THRESHOLD:
+            return Polynomial(PointSet(xs).evaluate(self))
         samples: list[Scalar] = []
         for x in xs:
             samples.append(self.evaluate(x))
@@ -229,13 +342,138 @@ class Polynomial:
                 c[i + j] += u * v
         return Polynomial(c)
 
+    def mul_karatsuba(self, b) -> Polynomial:
+        if isinstance(b, list):
+            b = Polynomial(b)
+        if self.n() == 0 or b.n() == 0:
+            return self.mul_naive(b)
+        c = _mul_karatsuba([e.n for e in self.coeffs], [e.n for e in b.coeffs])
+        return Polynomial([Scalar(e) for e in c])
+
+    def mul_ntt(self, b) -> Polynomial:
+        if isinstance(b, list):
+            b = Polynomial(b)
+        if self.n() == 0 or b.n() == 0:
+            return self.mul_naive(b)
+        # smallest domain that fits the product
+        size = self.n() + b.n() - 1
+        domain = NTT_DOMAIN(max(log2(size), 1))
+        u = domain.fft_in_place(pad_scalars(self.coeffs, domain.n))
+        v = domain.fft_in_place(pad_scalars(b.coeffs, domain.n))
+        c = domain.ifft_in_place([e0 * e1 for e0, e1 in zip(u, v)])
+        return Polynomial(c[:size])
+
+    def mul(self, b) -> Polynomial:
+        if isinstance(b, list):
+            b = Polynomial(b)
+        if NTT_DOMAIN is not None and min(self.n(), b.n()) >= MUL_NTT_THRESHOLD:
+            return self.mul_ntt(b)
+        return self.mul_karatsuba(b)
+
+    def div_linear(self, z: Scalar) -> tuple[Polynomial, Scalar]:
+        # ruffini's rule, returns `q(X)` and `r` where `p(X) = q(X) * (X - z) + r`
+        if self.n() == 0:
+            return Polynomial([]), zero
+        p, z = Scalar.field_modulus, z.n
+        q = [None] * (self.n() - 1)
+        acc = 0
+        for i in reversed(range(1, self.n())):
+            acc = (acc * z + self.coeffs[i].n) % p
+            q[i - 1] = Scalar(acc)
+        r = Scalar(acc * z + self.coeffs[0].n)
+        return Polynomial(q), r
+
+    def div_by_vanishing(self, points: list[Scalar]) -> tuple[Polynomial, Polynomial]:
+        # long division by monic `∏(X - x_i)`, meant for small sets of roots
+        p = Scalar.field_modulus
+        d = [1]
+        for x in points:
+            d = [(u - x.n * v) % p for u, v in zip([0] + d, d + [0])]
+        k = len(d) - 1
+        if self.n() <= k:
+            return Polynomial([]), self.clone()
+
+        r = [e.n for e in self.coeffs]
+        q = [None] * (self.n() - k)
+        for i in reversed(range(self.n() - k)):
+            c = r[i + k] % p
+            q[i] = Scalar(c)
+            if c != 0:
+                for j in range(k):
+                    r[i + j] -= c * d[j]
+        return Polynomial(q), Polynomial([Scalar(e) for e in r[:k]])
+
+    def divmod(self, d: Polynomial) -> tuple[Polynomial, Polynomial]:
+        if isinstance(d, SparsePolynomial):
+            return self.div_sparse(d)
+        a, d = self.trim_zeros(), d.trim_zeros()
+        assert not d.is_zero()
+        n, k = a.n(), d.n()
+        if n < k:
+            return Polynomial([]), a
+        m = n - k + 1
+
+        if min(m, k) <= DIV_NEWTON_THRESHOLD:
+            p = Scalar.field_modulus
+            lead_inv = d.coeffs[-1].inverse().n
+            r, d = [e.n for e in a.coeffs], [e.n for e in d.coeffs]
+            q = [None] * m
+            for i in reversed(range(m)):
+                c = r[i + k - 1] * lead_inv % p
+                q[i] = Scalar(c)
+                if c != 0:
+                    for j in range(k - 1):
+                        r[i + j] -= c * d[j]
+            return Polynomial(q), Polynomial([Scalar(e) for e in r[:k - 1]])
+
+        # `rev(q) = rev(a) / rev(d) mod X^m`
+        inv = Polynomial(d.coeffs[::-1]).inv_series(m)
+        rev_q = Polynomial(a.coeffs[::-1][:m]) * inv
+        q = Polynomial(pad_scalars(rev_q.coeffs[:m], m)[::-1])
+        r = a - q * d
+        return q, Polynomial(pad_scalars(r.coeffs[:k - 1], k - 1))
+
+    def div_sparse(self, d: SparsePolynomial) -> tuple[Polynomial, Polynomial]:
+        # long division costs `O(n * t)` for a divisor with `t` terms
+        a, k = self.trim_zeros(), d.degree()
+        assert k >= 0
+        if a.n() <= k:
+            return Polynomial([]), a
+
+        p, m = Scalar.field_modulus, a.n() - k
+        lead_inv = d.terms[-1][1].inverse().n
+        lower = [(j, c.n) for j, c in d.terms[:-1]]
+        r = [e.n for e in a.coeffs]
+        q = [None] * m
+        for i in reversed(range(m)):
+            c = r[i + k] * lead_inv % p
+            q[i] = Scalar(c)
+            if c != 0:
+                for j, u in lower:
+                    r[i + j] -= c * u
+        return Polynomial(q), Polynomial([Scalar(e) for e in r[:k]])
+
+    def inv_series(self, m: int) -> Polynomial:
+        # newton iteration `g = g * (2 - f * g) mod X^l`
+        assert self[0] != zero
+        g, l = Polynomial([self[0].inverse()]), 1
+        while l < m:
+            l = min(l << 1, m)
+            e = pad_scalars((self[:l] * g).coeffs[:l], l)
+            e = [-c for c in e]
+            e[0] = e[0] + Scalar(2)
+            g = Polynomial((g * Polynomial(e)).coeffs[:l])
+        return g
+
+    def derivative(self) -> Polynomial:
+        return Polynomial([a * Scalar(i) for i, a in enumerate(self.coeffs)][1:])
+
     def mul_sample(self, other) -> Polynomial:
         n = min(self.n(), other.n())
         return Polynomial([self.coeffs[i] * other.coeffs[i] for i in range(n)])
 
     def inv_sample(self) -> Polynomial:
-        # TODO: use batch inversion
-        return Polynomial([one / a for a in self.coeffs])
+        return Polynomial(batch_inverse(self.coeffs))
 
     def __eq__(self, other):
         return self.eq(other)
@@ -255,7 +493,7 @@ class Polynomial:
     def __mul__(self, other):
         if isinstance(other, Scalar):
             return self.scale(other)
-        return self.mul_naive(other)
+        return self.mul(other)
 
     def __repr__(self) -> str:
         return self.debug_str("", False)
@@ -273,3 +511,80 @@ class Polynomial:
     #         return self.clone()
     #     u = self.distribute(k) / z.distribute(k)
     #     return u.distribute(one / k)
+
+
+class SparsePolynomial:
+
+    def __init__(self, terms: list[tuple[int, Scalar]]):
+
+        # `(degree, coefficient)` pairs sorted by degree
+        merged: dict[int, Scalar] = {}
+        for i, c in terms:
+            merged[i] = merged.get(i, zero) + c
+        self.terms = sorted([(i, c) for i, c in merged.items() if c != zero], key=lambda term: term[0])
+
+    def __call__(self, z) -> Scalar:
+        return self.evaluate(z)
+
+    def degree(self) -> int:
+        return self.terms[-1][0] if len(self.terms) > 0 else -1
+
+    def is_zero(self) -> bool:
+        return len(self.terms) == 0
+
+    def evaluate(self, x: Scalar) -> Scalar:
+        acc = zero
+        for i, c in self.terms:
+            acc = acc + c * x**i
+        return acc
+
+    def dense(self) -> Polynomial:
+        coeffs = [zero] * (self.degree() + 1)
+        for i, c in self.terms:
+            coeffs[i] = c
+        return Polynomial(coeffs)
+
+    def __repr__(self) -> str:
+        return " + ".join("{}*X^{}".format(c, i) for i, c in self.terms)
+
+
+class PointSet:
+
+    def __init__(self, points: list[Scalar]):
+
+        assert len(points) > 0
+        self.points = list(points)
+        self.weights = None
+
+        # subproduct tree, leaves are `X - x_i` and the root is the vanishing polynomial
+        level = [Polynomial.degree_one(x) for x in self.points]
+        self.tree = [level]
+        while len(level) > 1:
+            level = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)] + level[len(level) & ~1:]
+            self.tree.append(level)
+
+    def n(self) -> int:
+        return len(self.points)
+
+    def vanishing(self) -> Polynomial:
+        return self.tree[-1][0]
+
+    def evaluate(self, poly: Polynomial) -> list[Scalar]:
+
+        # remainders travel from the root down to leaves
+        rems = [poly.divmod(self.vanishing())[1]]
+        for level in reversed(self.tree[:-1]):
+            rems = [rems[i >> 1].divmod(node)[1] for i, node in enumerate(level)]
+        return [r[0] for r in rems]
+
+    def interpolate(self, values: list[Scalar]) -> Polynomial:
+
+        assert len(values) == self.n()
+        if self.weights is None:
+            self.weights = batch_inverse(self.evaluate(self.vanishing().derivative()))
+
+        # `∑ v_i / m'(x_i) * m(X) / (X - x_i)` combined from leaves to the root
+        acc = [Polynomial([v * w]) for v, w in zip(values, self.weights)]
+        for level in self.tree[:-1]:
+            acc = [acc[i] * level[i + 1] + acc[i + 1] * level[i] for i in range(0, len(level) - 1, 2)] + acc[len(level) & ~1:]
+        return acc[0].pad(self.n())
@@ -4,8 +4,27 @@ from polynom.ecc import Point, CURVE, Scalar
 
 class Hasher:
 
-    def __init__(self, person: bytes, scalar_prefix: bytes, challenge_prefix: bytes, point_prefix: bytes):
-        pass
+    # point format for subclasses that do not call `Hasher.__init__`
+    compressed: bool = False
+
+    def __init__(self, person: bytes, scalar_prefix: bytes, challenge_prefix: bytes, point_prefix: bytes, compressed: bool = False):
+        self.compressed = compressed
+
+    def point_size(self) -> int:
+        # points are hashed and written to proofs in the same format
+        return CURVE.compressed_point_size() if self.compressed else CURVE.uncompressed_point_size()
+
+    def encode_point(self, e: Point) -> bytes:
+        return e.to_compressed() if self.compressed else e.to_uncompressed()
+
+    def decode_point(self, input: bytes) -> Point:
+        return Point.from_compressed(input) if self.compressed else Point.from_uncompressed(input)
+
+    def decode_points(self, input: bytes) -> list[Point]:
+        if self.compressed:
+            return Point.from_compressed_batch(input)
+        u = self.point_size()
+        return [Point.from_uncompressed(input[i:i + u]) for i in range(0, len(input), u)]
 
     def update_scalar(self, e: Scalar):
         pass
@@ -13,6 +32,10 @@ class Hasher:
     def update_point(self, e: Point):
         pass
 
+    def update_points(self, points: list[Point]) -> bytes:
+        # same input as updating one by one, affine forms are found together
+        return b"".join(self.update_point(point) for point in Point.normalize_batch(points))
+
     def challenge(self) -> Scalar:
         pass
 
@@ -31,11 +54,12 @@ class SHA256(Hasher):
         hasher.update(person)
         return hasher
 
-    def __init__(self, person: bytes, scalar_prefix: bytes, challenge_prefix: bytes, point_prefix: bytes):
+    def __init__(self, person: bytes, scalar_prefix: bytes, challenge_prefix: bytes, point_prefix: bytes, compressed: bool = False):
         self.scalar_prefix = scalar_prefix
         self.point_prefix = point_prefix
         self.challenge_prefix = challenge_prefix
         self.person = person
+        super().__init__(person, scalar_prefix, challenge_prefix, point_prefix, compressed)
         self.hasher = self.clean_state()
 
     def update_scalar(self, e: Scalar) -> bytes:
@@ -46,7 +70,7 @@ class SHA256(Hasher):
 
     def update_point(self, e: Point) -> bytes:
         self.hasher.update(self.point_prefix)
-        in_bytes = e.to_uncompressed()
+        in_bytes = self.encode_point(e)
         self.hasher.update(in_bytes)
         return in_bytes
 
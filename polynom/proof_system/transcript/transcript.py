@@ -26,13 +26,23 @@ class TranscriptRead(Transcript):
         self.offset = 0
 
     def read_point(self) -> Point:
-        point_size = CURVE.uncompressed_point_size()
+        point_size = self.hasher.point_size()
         assert len(self.message) >= self.offset + point_size
-        point = Point.from_uncompressed(self.message[self.offset:self.offset + point_size])
+        point = self.hasher.decode_point(self.message[self.offset:self.offset + point_size])
         self.offset += point_size
         self.write_point_to_state(point)
         return point
 
+    def read_points(self, n: int) -> list[Point]:
+        # consecutive points are decoded together
+        point_size = self.hasher.point_size()
+        assert len(self.message) >= self.offset + n * point_size
+        points = self.hasher.decode_points(self.message[self.offset:self.offset + n * point_size])
+        self.offset += n * point_size
+        for point in points:
+            self.write_point_to_state(point)
+        return points
+
     def read_scalar(self) -> Scalar:
         scalar_size = CURVE.scalar_size()
         assert len(self.message) >= self.offset + scalar_size
@@ -52,6 +62,9 @@ class TranscriptWrite(Transcript):
     def write_point(self, point: Point):
         self.message += self.write_point_to_state(point)
 
+    def write_points(self, points: list[Point]):
+        self.message += self.hasher.update_points(points)
+
     def write_scalar(self, e: Scalar):
         self.message += self.write_scalar_to_state(e)
 
@@ -1,4 +1,4 @@
-from polynom.ecc import Point, Scalar, zero, one
+from polynom.ecc import Point, Scalar, zero
 
 
 def log2(n: int) -> int:
@@ -19,11 +19,13 @@ def trim_zeros(coeffs: list[Scalar]) -> list[Scalar]:
 
 
 def pad_scalars(u: list[Scalar], n: int, el=zero) -> list[Scalar]:
-    return u[:] + (n - len(u)) * [el]
+    return list(u) + (n - len(u)) * [el]
 
 
-def pad_points(u: list[Point], n: int, el=Point.ZERO()) -> list[Point]:
-    return u[:] + (n - len(u)) * [el]
+def pad_points(u: list[Point], n: int, el: Point = None) -> list[Point]:
+    # zero is taken from the active backend at call time
+    el = Point.ZERO() if el is None else el
+    return list(u) + (n - len(u)) * [el]
 
 
 def bit_reverse(A: list[Scalar], n: int):
@@ -47,8 +49,30 @@ def i_to_fr(*v: int) -> list[Scalar]:
 
 
 def batch_inverse(domain: list[Scalar]) -> list[Scalar]:
-    # TODO: apperently suboptimal
-    inverse_domain = []
-    for w in domain:
-        inverse_domain.append(one / w)
-    return inverse_domain
+    if len(domain) == 0:
+        return []
+    F = type(domain[0])
+    return [F(w) for w in batch_inverse_int([w.n for w in domain], F.field_modulus)]
+
+
+def batch_inverse_int(values: list[int], p: int) -> list[int]:
+    # montgomery's trick: one inversion and ~3n multiplications
+    # zero maps to zero as it does with `one / zero`
+    if len(values) == 0:
+        return []
+
+    acc, prefix = 1, []
+    for w in values:
+        prefix.append(acc)
+        if w != 0:
+            acc = acc * w % p
+
+    acc = pow(acc, -1, p)
+    inverses = [0] * len(values)
+    for i in reversed(range(len(values))):
+        w = values[i]
+        if w == 0:
+            continue
+        inverses[i] = acc * prefix[i] % p
+        acc = acc * w % p
+    return inverses
@@ -8,6 +8,11 @@ from polynom.ecc.bn254.bn254 import BN254
 
 init_ecc(BN254)
 
+from polynom.polynomial import init_ntt_domain
+from polynom.ecc.bn254.domain import new_domain
+
+init_ntt_domain(new_domain)
+
 person = b"polynom test"
 scalar_prefix = b"polynom test scalar"
 challenge_prefix = b"polynom test challenge"
@@ -135,3 +135,183 @@ def test_lagrage_polynomial():
     for i in range(domain.n):
         li_x = domain.lagrange_polynomial(i)
         assert li_x(zeta) == domain.lagrange_evaluation(i, zeta)
+        assert li_x.evaluate_multi(domain.domain) == Polynomial([one if i == j else Scalar(0) for j in range(domain.n)])
+
+    evals = domain.lagrange_evaluation_range(3, 9, zeta)
+    assert evals == [domain.lagrange_evaluation(i, zeta) for i in range(3, 9)]
+    assert domain.lagrange_evaluation_range(0, 4, domain.domain[2]) == [Scalar(0), Scalar(0), one, Scalar(0)]
+
+    A = Polynomial.rand(domain.n >> 1)
+    A_x = domain.interpolate(A)
+    assert domain.evaluate_lagrange(A.coeffs, zeta) == A_x(zeta)
+    assert domain.evaluate_lagrange(A.coeffs, domain.domain[1]) == A[1]
+
+
+def test_fft_in_place():
+    from polynom.domain.fft import bit_reverse_indices
+    from polynom.utils import bit_reverse
+
+    for i in range(1, 6):
+        domain = new_domain(i)
+        u = list(range(domain.n))
+        assert bit_reverse(u, i) == [u[r] for r in bit_reverse_indices(i)]
+
+        A_x = Polynomial.rand(domain.n)
+        A = A_x.coeffs[:]
+        assert domain.fft_in_place(A) is A
+        assert A == A_x.evaluate_multi(domain.domain).coeffs
+        assert domain.ifft_in_place(A) is A
+        assert Polynomial(A) == A_x
+
+
+def test_registry():
+    from polynom.domain import Domain
+    from polynom.domain.registry import DomainRegistry
+    from polynom.ecc.bn254.domain import root_of_unity, s, k
+
+    registry = DomainRegistry(root_of_unity, s, k)
+    large = registry.get(5)
+    assert registry.get(5) is large
+    for exp in range(1, 6):
+        domain = registry.get(exp)
+        fresh = Domain(root_of_unity, s, exp, k)
+        assert domain.domain == fresh.domain
+        assert domain.inverse_domain == fresh.inverse_domain
+        assert domain.twiddles == fresh.twiddles
+        assert domain.inverse_twiddles == fresh.inverse_twiddles
+    assert registry.largest is large
+
+
+def test_coset_lde():
+    domain = new_domain(3)
+    A_x = Polynomial.rand(domain.n)
+    A = domain.coset_evaluate(A_x)
+    assert A == A_x.evaluate_multi(domain.coset(domain.k))
+    assert domain.coset_interpolate(A) == A_x
+
+    for blowup in [1, 2, 4, 8]:
+        extended = domain.extended(blowup)
+        assert extended.n == domain.n * blowup
+        A = domain.lde(A_x, blowup)
+        assert A == A_x.evaluate_multi(extended.coset(domain.k))
+        assert extended.coset_interpolate(A) == A_x
+
+
+def test_divide_by_vanishing():
+    domain = new_domain(3)
+    z_x = domain.vanishing_sparse()
+    assert z_x.dense() == domain.vanishing()
+    zeta = Scalar.rand()
+    assert z_x(zeta) == domain.vanishing()(zeta)
+
+    for blowup in [2, 4]:
+        h_x = Polynomial.rand(domain.n * (blowup - 1))
+        t_x = h_x * domain.vanishing()
+        q_x = domain.divide_by_vanishing(t_x, blowup)
+        assert q_x == h_x
+        t = domain.extended(blowup).coset_evaluate(t_x)
+        q_x = domain.divide_by_vanishing(t.coeffs, blowup)
+        assert q_x == h_x
+
+        Q, R = (t_x + Polynomial.rand(3)).divmod(z_x)
+        assert Q == h_x
+        assert R.n() == domain.n
+
+
+def test_evaluations():
+    from polynom.domain import Evaluations
+
+    domain = new_domain(3)
+    for coset in [False, True]:
+        A_x = Polynomial.rand(domain.n >> 1)
+        B_x = Polynomial.rand(domain.n >> 1)
+        A = Evaluations.from_poly(domain, A_x, coset)
+        B = Evaluations.from_poly(domain, B_x, coset)
+        u = Scalar.rand()
+        zeta = Scalar.rand()
+
+        assert (A + B).poly() == A_x + B_x
+        assert (A - B).poly() == A_x - B_x
+        assert (A * B).poly() == A_x * B_x
+        assert (A * u).poly() == A_x * u
+        assert (-A).poly() == -A_x
+        assert ((A * B) / B) == A
+        assert (A * B)(zeta) == A_x(zeta) * B_x(zeta)
+        assert Evaluations(domain, A.evals, coset).poly() == A_x
+
+
+def test_parallel_fft():
+    from polynom.domain import Domain
+    from polynom.domain.fft import perform_fft
+    from polynom.ecc.bn254.domain import root_of_unity, s, k
+
+    shared = Domain(root_of_unity, s, 7, k)
+    domain = shared.with_parallel(max_workers=2, threshold=0)
+    assert shared.parallel is None
+    assert domain.parallel.workers == 2
+    assert domain.domain is shared.domain
+    try:
+        for exp in [1, 2, 5, 7]:
+            A = [Scalar.rand() for _ in range(1 << exp)]
+            sub = domain.subdomain(exp)
+            assert domain.parallel.fft(A) == perform_fft(A, sub.domain)
+            assert domain.parallel.fft(A, inverse=True) == perform_fft(A, sub.inverse_domain)
+
+        A_x = Polynomial.rand(domain.n)
+        A = domain.evaluate(A_x)
+        assert A == A_x.evaluate_multi(domain.domain)
+        assert domain.interpolate(A) == A_x
+    finally:
+        domain.disable_parallel()
+
+
+def test_parallel_quotient():
+    from polynom.domain import Domain
+    from polynom.ecc.bn254.domain import root_of_unity, s, k
+
+    shared = Domain(root_of_unity, s, 4, k)
+    domain = shared.with_parallel(max_workers=2, threshold=0, max_blowup=4)
+    assert domain.parallel.domain.n == 4 * shared.n
+    assert domain.extended(4).parallel is domain.parallel
+    assert domain.extended(8).parallel is None
+
+    # count transforms reaching the pool
+    calls = []
+    fft = domain.parallel.fft
+    domain.parallel.fft = lambda A, *args, **kwargs: calls.append(len(A)) or fft(A, *args, **kwargs)
+    try:
+        h_x = Polynomial.rand(3 * shared.n)
+        t_x = h_x * shared.vanishing()
+        assert domain.divide_by_vanishing(t_x, 4) == shared.divide_by_vanishing(t_x, 4) == h_x
+        assert calls == [4 * shared.n, 4 * shared.n]
+        A_x = Polynomial.rand(shared.n)
+        assert domain.lde(A_x, 2) == shared.lde(A_x, 2)
+        assert domain.coset_interpolate(domain.coset_evaluate(A_x)) == A_x
+        assert domain.interpolate(domain.evaluate(A_x)) == A_x
+        assert calls == [4 * shared.n, 4 * shared.n, 2 * shared.n] + [shared.n] * 4
+    finally:
+        domain.disable_parallel()
+
+
+def test_fft_batch():
+    domain = new_domain(4)
+    v = [Polynomial.rand(domain.n) for _ in range(5)] + [Polynomial.rand(3).coeffs]
+    evals = domain.fft_batch(*v)
+    for u, e in zip(v, evals):
+        assert e == domain.evaluate(u if isinstance(u, Polynomial) else Polynomial(u))
+    coeffs = domain.ifft_batch(*v)
+    for u, c in zip(v, coeffs):
+        assert c == domain.interpolate(u)
+    assert domain.ifft_batch(*evals)[:5] == v[:5]
+
+
+def test_prepare_coset_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from polynom.domain import Domain
+    from polynom.ecc.bn254.domain import root_of_unity, s, k
+
+    domain = Domain(root_of_unity, s, 6, k)
+    A_x = Polynomial.rand(domain.n)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: domain.coset_interpolate(domain.coset_evaluate(A_x)), range(16)))
+    assert all(r == A_x for r in results)
@@ -0,0 +1,115 @@
+from polynom.ecc import FIXED_BASE_TABLES, FIXED_BASE_TABLES_SIZE, Point, Scalar, fixed_base_table
+from polynom.ecc.msm import multiexp
+from polynom.ecc.bn254.native import BN254_NATIVE
+
+
+def test_multiexp():
+    for n in [1, 2, 5, 33, 70]:
+        bases = [Point.rand() for _ in range(n)]
+        scalars = [Scalar.rand() for _ in range(n)]
+        scalars[0] = Scalar(0)
+        acc = Point.ZERO()
+        for base, e in zip(bases, scalars):
+            acc = acc + base * e
+        assert multiexp(bases, scalars) == acc
+
+    bases = [Point.rand() for _ in range(4)]
+    assert multiexp(bases, [Scalar(0)] * 4) == Point.ZERO()
+    assert multiexp(bases, []) == Point.ZERO()
+    assert multiexp(bases, [Scalar(3), Scalar(1)]) == bases[0] * Scalar(3) + bases[1]
+
+
+def test_pairing_check():
+    from py_ecc.optimized_bn128 import pairing, FQ12
+    from polynom.ecc import CURVE, pairing_check
+
+    a, b = Scalar.rand(), Scalar.rand()
+    A, B = Point.G1(a), Point.G2(b)
+    assert pairing_check([(B, A), (-Point.G2(), Point.G1(a * b))])
+    assert not pairing_check([(B, A), (-Point.G2(), Point.G1(a * b + Scalar(1)))])
+    assert pairing_check([(B, A), (-Point.G2(a), Point.G1(b)), (Point.G2(), Point.ZERO())])
+
+    f = CURVE.final_exponentiation(CURVE.multi_miller_loop([(B, A)]))
+    assert f == pairing(B.point, A.point)
+    assert f != FQ12.one()
+
+
+def test_fixed_base():
+    G = Point(Point.G1().curve, Point.G1().curve.g1)
+    for s in [Scalar(0), Scalar(1), Scalar(-1), Scalar.rand(), Scalar.rand()]:
+        assert Point.G1(s) == G * s
+    P = Point.rand()
+    s = Scalar.rand()
+    assert P.mul_fixed(s) == P * s
+    assert P.mul_fixed(Scalar(2)) == P + P
+    assert Point.ZERO().mul_fixed(s) == Point.ZERO()
+
+    # tables are bounded and shared by equal points in any representation
+    for _ in range(FIXED_BASE_TABLES_SIZE + 1):
+        Point.rand().mul_fixed(s)
+    assert len(FIXED_BASE_TABLES) == FIXED_BASE_TABLES_SIZE
+    Q = P + P
+    assert fixed_base_table(P.curve, Q.point) is fixed_base_table(P.curve, Q.curve.normalize_batch([Q.point])[0])
+
+
+def test_native_backend():
+    # same operations on both backends must encode to the same bytes
+    R, N = Point.G1().curve, BN254_NATIVE
+    a, b = Scalar.rand(), Scalar.rand()
+    A, B = Point(R, R.g1) * a, Point(R, R.g1) * b
+    A_, B_ = Point(N, N.g1) * a, Point(N, N.g1) * b
+    assert A.to_uncompressed() == A_.to_uncompressed()
+
+    cases = [
+        (A + B, A_ + B_),
+        (A - B, A_ - B_),
+        (A + A, A_ + A_),
+        (A * b, A_ * b),
+        (-A, -A_),
+        (A + (-A) + B, A_ + (-A_) + B_),
+    ]
+    for expected, result in cases:
+        assert result.to_uncompressed() == expected.to_uncompressed()
+        assert result.is_on_curve()
+
+    # mixed and jacobian additions from decoded points
+    C_ = Point(N, N.from_uncompressed(A.to_uncompressed()))
+    assert C_ == A_
+    assert C_ + B_ * Scalar(3) == A_ + B_ + B_ + B_
+    assert (A_ - C_) == Point(N, N.z1)
+    assert Point(N, N.g1) * Scalar(0) == Point(N, N.z1)
+    assert (A_ + Point(N, N.z1)) == A_
+
+    n = 40
+    scalars = [Scalar.rand() for _ in range(n)]
+    bases = [Point(R, R.g1) * e for e in scalars[::-1]]
+    bases_ = [Point(N, N.from_uncompressed(base.to_uncompressed())) for base in bases]
+    assert multiexp(bases_, scalars).to_uncompressed() == multiexp(bases, scalars).to_uncompressed()
+    assert Point(N, N.g1).mul_fixed(a) == A_
+
+    # g2 stays with py_ecc and g1 is converted for the pairing
+    G2 = Point(N, N.g2)
+    assert N.pairing_check([(G2 * b, A_), (-G2, A_ * b)])
+    assert not N.pairing_check([(G2 * b, A_), (-G2, A_ * a)])
+
+
+def test_glv():
+    from py_ecc.optimized_bn128 import multiply, eq, G1, Z1, curve_order
+    from polynom.ecc.glv import wnaf, decompose
+    from polynom.ecc.bn254.bn254 import GLV_BASIS, GLV_LAMBDA, mul
+
+    for k in [1, 2, 7, 31, 32, 1000, Scalar.rand().n]:
+        for w in [2, 4, 5]:
+            digits = wnaf(k, w)
+            assert sum(d << i for i, d in enumerate(digits)) == k
+            assert all(d == 0 or (d % 2 == 1 and abs(d) < 1 << (w - 1)) for d in digits)
+
+    for _ in range(20):
+        k = Scalar.rand().n
+        k1, k2 = decompose(k, curve_order, GLV_BASIS)
+        assert (k1 + k2 * GLV_LAMBDA - k) % curve_order == 0
+        assert abs(k1).bit_length() <= 128 and abs(k2).bit_length() <= 128
+
+    for k in [0, 1, 2, 3, curve_order - 1, curve_order, GLV_LAMBDA, Scalar.rand().n]:
+        assert eq(mul(G1, k), multiply(G1, k))
+    assert eq(mul(Z1, 5), Z1)
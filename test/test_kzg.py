@@ -1,8 +1,12 @@
+import pytest
 from polynom.commitment.bdfg.prover import BatchBDFGProverKey, MultiBDFGProverKey
 from polynom.commitment.gwc import GWCKey
 from polynom.commitment.kzg_setup import KZGSetup
+from polynom.commitment.srs import SRS
+from polynom.commitment.srs_gen import generate_bases, generate_srs
 from polynom.polynomial import Polynomial
-from polynom.ecc import Scalar
+from polynom.domain import Evaluations
+from polynom.ecc import Point, Scalar
 from polynom.ecc.bn254.domain import new_domain
 from . import hasher
 
@@ -29,6 +33,110 @@ def test_kzg_commitment():
 
     assert P_0 == P_1
 
+    evals = Evaluations(domain, p.coeffs)
+    assert prover.commit_lagrange(evals) == P_0
+    assert prover.commit(evals) == P_0
+    assert prover.commit(Evaluations.from_poly(domain, p_x, True)) == P_0
+
+
+def test_kzg_lagrange_cache(tmp_path):
+
+    n = 3
+    domain = new_domain(n)
+    KZG = KZGSetup.new(domain, hasher(), str(tmp_path))
+    assert KZG._inverse_bases is None
+    expected = domain.ecc_interpolate(KZG.bases)
+    assert KZG.lagrange_bases() == expected
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # reloaded from disk for the same srs and domain
+    reloaded = KZGSetup(KZG.bases, domain, KZG.X_2, hasher(), str(tmp_path))
+    assert reloaded.lagrange_bases() == expected
+
+    # corrupted and reordered files are recomputed
+    size = KZG.bases[0].curve.uncompressed_point_size()
+    with open(reloaded.lagrange_path(), "rb") as f:
+        data = f.read()
+    points = [data[40 + i * size:40 + (i + 1) * size] for i in range(domain.n)]
+    for corrupted in [[KZG.bases[1].to_uncompressed()] + points[1:], points[1:2] + points[:1] + points[2:]]:
+        with open(reloaded.lagrange_path(), "wb") as f:
+            f.write(data[:40] + b"".join(corrupted))
+        reloaded = KZGSetup(KZG.bases, domain, KZG.X_2, hasher(), str(tmp_path))
+        assert reloaded.lagrange_bases() == expected
+
+    # garbage and truncated files are recomputed and rewritten
+    path = reloaded.lagrange_path()
+    with open(path, "rb") as f:
+        data = f.read()
+    for garbage in [data[:8] + bytes(range(256)) * 2, data[:100], b""]:
+        with open(path, "wb") as f:
+            f.write(garbage)
+        reloaded = KZGSetup(KZG.bases, domain, KZG.X_2, hasher(), str(tmp_path))
+        assert reloaded.lagrange_bases() == expected
+        with open(path, "rb") as f:
+            assert f.read() == data
+
+    prover = KZG.prover_kzg()
+    a = Polynomial.rand(domain.n)
+    assert prover.commit_lagrange(domain.evaluate(a)) == prover.commit(a)
+
+
+def test_srs_file(tmp_path):
+
+    KZG = kzg_setup(3)
+    path = str(tmp_path / "srs.bin")
+    KZG.save(path, lagrange=True)
+
+    srs = SRS.open(path)
+    assert srs.n() == 8
+    assert srs.X_2 == KZG.X_2
+    assert len(srs.bases.decoded) == 0
+    assert list(srs.bases) == KZG.bases
+
+    # lagrange section is used for the same domain
+    loaded = KZGSetup.from_srs(srs, KZG.domain, hasher())
+    assert loaded.inverse_bases is srs.lagrange
+    assert list(loaded.inverse_bases) == KZG.inverse_bases
+
+    # smaller setup is a prefix of the same mapping
+    domain = new_domain(2)
+    small = KZGSetup.from_srs(srs, domain, hasher())
+    assert len(small.bases) == 4
+    assert small.bases.buffer is srs.bases.buffer
+    assert list(small.lagrange_bases()) == domain.ecc_interpolate(KZG.bases[:4])
+
+    prover, verifier = small.prover_kzg(), small.verifier_kzg()
+    a = Polynomial.rand(domain.n)
+    assert prover.commit(a) == prover.commit_lagrange(domain.evaluate(a))
+    assert verifier.verify(prover.create_proof(a))
+
+    for size in [100, 4, 0]:
+        with open(path, "r+b") as f:
+            f.truncate(size)
+        with pytest.raises(ValueError, match="truncated"):
+            SRS.open(path)
+
+
+def test_srs_generation(tmp_path):
+
+    tau = Scalar.rand()
+    n = 20
+    expected = [Point.G1(tau**i) for i in range(n)]
+
+    path = str(tmp_path / "srs.bin")
+    generate_srs(path, tau, n, max_workers=2, chunk_size=6, in_flight=1)
+    srs = SRS.open(path)
+    assert list(srs.bases) == expected
+    assert srs.X_2 == Point.G2(tau)
+    assert srs.lagrange is None
+
+    # `tau = 0` gives infinity for all but the first base
+    assert generate_bases(Scalar(0), 3) == [Point.G1(), Point.ZERO(), Point.ZERO()]
+    generate_srs(path, Scalar(0), 3, max_workers=1)
+    with open(path, "rb") as f:
+        assert f.read()[-128:] == bytes(128)
+    assert list(SRS.open(path).bases) == [Point.G1(), Point.ZERO(), Point.ZERO()]
+
 
 def test_kzg_single():
 
@@ -161,3 +269,87 @@ def test_bdfg_batch():
     key_multi_0, key_multi_1 = verifier.new_multi_key(shifts_0), verifier.new_multi_key(shifts_1)
     key = verifier.new_batch_key([key_multi_0, key_multi_1])
     assert verifier.verifiy_batch(proof, key)
+
+
+def test_native_backend():
+    from polynom.ecc import CURVE, init_ecc
+    from polynom.ecc.bn254.native import BN254_NATIVE
+
+    a = Polynomial.rand(8)
+    expected = kzg_setup(3).prover_kzg().commit(a).to_uncompressed()
+
+    reference = CURVE
+    init_ecc(BN254_NATIVE)
+    try:
+        KZG = kzg_setup(3)
+        prover, verifier = KZG.prover_kzg(), KZG.verifier_kzg()
+        assert verifier.verify(prover.create_proof(a))
+        assert prover.commit(a).to_uncompressed() == expected
+        assert prover.commit_lagrange(KZG.domain.evaluate(a)).to_uncompressed() == expected
+    finally:
+        init_ecc(reference)
+
+
+def tamper(proof: bytes, offset: int) -> bytes:
+    # replaces the scalar at `offset` keeping the proof well formed
+    return proof[:offset] + Scalar.rand().n.to_bytes(32, "little") + proof[offset + 32:]
+
+
+def test_verify_many():
+
+    n = 3
+    KZG = kzg_setup(n)
+
+    prover, verifier = KZG.prover_kzg(), KZG.verifier_kzg()
+    proofs = [prover.create_proof(Polynomial.rand(1 << n)) for _ in range(7)]
+    assert verifier.verify_many(proofs) == [True] * 7
+    proofs[2], proofs[5] = tamper(proofs[2], 64), tamper(proofs[5], 64)
+    proofs[6] = proofs[6][:100]
+    assert verifier.verify_many(proofs) == [True, True, False, True, True, False, False]
+    assert verifier.verify_many([]) == []
+
+    polys = [Polynomial.rand(1 << n) for _ in range(3)]
+    proofs = [prover.create_proof_batch(polys) for _ in range(3)]
+    proofs[0] = tamper(proofs[0], 64 * 3)
+    assert verifier.verify_batch_many(3, proofs) == [False, True, True]
+
+    prover, verifier = KZG.prover_gwc(), KZG.verifier_gwc()
+    key = GWCKey({0: [1, 0], 1: [0, 1], 3: [1]})
+    proofs = [prover.create_proof([Polynomial.rand(1 << n) for _ in range(2)], key) for _ in range(4)]
+    proofs[3] = tamper(proofs[3], 64 * 2)
+    assert verifier.verify_many(key, proofs) == [True, True, True, False]
+
+    prover, verifier = KZG.prover_bdfg(), KZG.verifier_bdfg()
+    shifts_0, shifts_1 = [1, 2, 3], [1, 2]
+    proofs_single, proofs_batch = [], []
+    for _ in range(3):
+        key_multi_0 = prover.new_multi_key(Polynomial.rand(1 << n), shifts_0)
+        key_multi_1 = prover.new_multi_key(Polynomial.rand(1 << n), shifts_1)
+        proofs_single.append(prover.create_proof_single(key_multi_0))
+        proofs_batch.append(prover.create_proof_batch(prover.new_batch_key([key_multi_0, key_multi_1])))
+    proofs_single[1] = tamper(proofs_single[1], 64)
+    proofs_batch[0] = tamper(proofs_batch[0], 64 * 2)
+
+    key_multi_0, key_multi_1 = verifier.new_multi_key(shifts_0), verifier.new_multi_key(shifts_1)
+    assert verifier.verify_many(proofs_single, key_multi_0) == [True, False, True]
+    key = verifier.new_batch_key([key_multi_0, key_multi_1])
+    assert verifier.verify_many(proofs_batch, key) == [False, True, True]
+
+
+def test_compressed_proofs():
+    from polynom.proof_system.transcript.hasher import SHA256
+    from . import person, scalar_prefix, challenge_prefix, point_prefix
+
+    n = 3
+    domain = new_domain(n)
+    KZG = KZGSetup.new(domain, SHA256(person, scalar_prefix, challenge_prefix, point_prefix, compressed=True))
+    prover, verifier = KZG.prover_kzg(), KZG.verifier_kzg()
+    polys = [Polynomial.rand(1 << n) for _ in range(3)]
+
+    proof = prover.create_proof(polys[0])
+    assert len(proof) == 32 * 3
+    assert verifier.verify(proof)
+
+    proofs = [prover.create_proof_batch(polys) for _ in range(2)]
+    assert len(proofs[0]) == 32 * 3 + 32 * 3 + 32
+    assert verifier.verify_batch_many(3, proofs) == [True, True]
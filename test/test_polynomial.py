@@ -80,3 +80,144 @@ def test_barycentric_formula():
     eval_1 = f_x(z)
 
     assert eval_0 == eval_1
+
+
+def test_batch_inverse():
+    from polynom.utils import batch_inverse
+    assert batch_inverse([]) == []
+    u = [Scalar.rand() for _ in range(20)]
+    u[3], u[11] = Scalar(0), Scalar(1)
+    assert batch_inverse(u) == [Scalar(1) / e for e in u]
+
+
+def test_mul():
+    for n, m in [(0, 3), (1, 1), (3, 17), (17, 3), (16, 17), (40, 33), (7, 90), (70, 70)]:
+        A = Polynomial.rand(n) if n > 0 else Polynomial.zero()
+        B = Polynomial.rand(m)
+        C = A.mul_naive(B)
+        assert A * B == C
+        assert (A * B).n() == C.n()
+        assert A.mul_karatsuba(B) == C
+        if n > 0:
+            assert A.mul_ntt(B) == C
+            assert A.mul_ntt(B).n() == C.n()
+
+
+def test_div():
+    for n in [1, 2, 9]:
+        A = Polynomial.rand(n)
+        z = Scalar.rand()
+        Q, r = A.div_linear(z)
+        assert r == A(z)
+        assert Q * Polynomial.degree_one(z) + r == A
+
+    A = Polynomial.rand(20)
+    points = [Scalar.rand() for _ in range(4)]
+    Q, R = A.div_by_vanishing(points)
+    Z = Polynomial.one()
+    for point in points:
+        Z = Z * Polynomial.degree_one(point)
+    assert R.n() == len(points)
+    assert Q * Z + R == A
+    for point in points:
+        assert R(point) == A(point)
+
+    Q, R = Polynomial.rand(3).div_by_vanishing(points)
+    assert Q.is_zero()
+
+
+def test_point_set():
+    from polynom.polynomial import PointSet
+
+    for n in [1, 2, 5, 40]:
+        xs = [Scalar.rand() for _ in range(n)]
+        ys = [Scalar.rand() for _ in range(n)]
+        point_set = PointSet(xs)
+        f_x = point_set.interpolate(ys)
+        assert f_x.n() == n
+        assert point_set.evaluate(f_x) == ys
+        for x in xs:
+            assert point_set.vanishing()(x) == Scalar(0)
+        A = Polynomial.rand(3 * n)
+        assert point_set.evaluate(A) == [A(x) for x in xs]
+        assert A.evaluate_multi(xs) == Polynomial([A(x) for x in xs])
+
+    for n, k in [(5, 2), (80, 70), (150, 66), (3, 9)]:
+        A, D = Polynomial.rand(n), Polynomial.rand(k)
+        Q, R = A.divmod(D)
+        assert Q * D + R == A
+        assert R.degree() < D.degree()
+
+
+def test_eval_cache():
+    from polynom.eval_cache import init_eval_cache, EVAL_CACHE_SIZE
+
+    try:
+        init_eval_cache(2)
+        A = Polynomial.rand(4)
+        x, y, z = Scalar.rand(), Scalar.rand(), Scalar.rand()
+        e = A(x)
+        assert A(x) == e
+        assert A.cache.stats.hits == 1 and A.cache.stats.misses == 1
+        A(y), A(z)
+        assert len(A.cache) == 2
+        assert A.cache.stats.evictions == 1
+
+        # clones start warm
+        B = A.clone()
+        B(z)
+        assert B.cache.stats.hits == 1
+
+        # mutations invalidate
+        A.coeffs = [c + Scalar(1) for c in A.coeffs]
+        assert len(A.cache) == 0
+        assert A(x) == e + Scalar(1) * (Scalar(1) + x + x**2 + x**3)
+        A.coeffs[0] = A.coeffs[0] + Scalar(1)
+        A.invalidate()
+        assert A(x) == Polynomial(A.coeffs[:])(x)
+
+        init_eval_cache(0)
+        assert Polynomial.rand(4).cache is None
+        assert A.clone()(x) == A(x)
+    finally:
+        init_eval_cache(EVAL_CACHE_SIZE)
+
+
+def test_evaluate_cached():
+    from polynom.polynomial import evaluate
+    from polynom.eval_cache import init_eval_cache, EVAL_CACHE_SIZE
+
+    try:
+        init_eval_cache(4)
+        A, B = Polynomial.rand(5), Polynomial.rand(3)
+        x = Scalar.rand()
+        e = A(x)
+        assert evaluate(x, A) == [e]
+        assert A.cache.stats.hits == 1 and A.cache.stats.misses == 1
+        evals = evaluate(x, A, B)
+        assert A.cache.stats.hits == 2 and B.cache.stats.misses == 1
+        # repeated calls are served from the cache
+        assert evaluate(x, A, B) == evals == [A(x), B(x)]
+        assert A.cache.stats.hits == 4 and B.cache.stats.hits == 2
+        assert A.cache.stats.misses == 1 and B.cache.stats.misses == 1
+    finally:
+        init_eval_cache(EVAL_CACHE_SIZE)
+
+
+def test_eval_many():
+    from polynom.polynomial import evaluate_many
+    from polynom.ecc.bn254.domain import new_domain
+
+    v = [Polynomial.rand(n) for n in [1, 4, 7]]
+    points = [Scalar.rand() for _ in range(3)]
+    evals = evaluate_many(points, *v)
+    for point, evals_j in zip(points, evals):
+        assert evals_j == [Polynomial(u.coeffs[:])(point) for u in v]
+
+    domain = new_domain(3)
+    z = Scalar.rand()
+    shifts = [0, 1, -1, 19]
+    evals = domain.evaluate_shifted(z, shifts, *v)
+    for shift_val, evals_j in zip(shifts, evals):
+        point = z * domain.w()**(shift_val % domain.n)
+        assert evals_j == [Polynomial(u.coeffs[:])(point) for u in v]
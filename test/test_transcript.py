@@ -1,7 +1,8 @@
+import pytest
 from polynom.ecc import Point, Scalar, CURVE
 from polynom.proof_system.transcript.transcript import Transcript, TranscriptRead, TranscriptWrite
-from polynom.proof_system.transcript.hasher import SHA256
-from . import hasher
+from polynom.proof_system.transcript.hasher import Hasher, Keccak256, SHA256
+from . import hasher, person, scalar_prefix, challenge_prefix, point_prefix
 
 
 def test_conversion():
@@ -75,3 +76,92 @@ def test_transcript():
     assert ch_5 == ch_5_read
     assert ch_6 == ch_6_read
     assert ch_7 == ch_7_read
+
+
+def test_compression():
+    from polynom.ecc.bn254.native import BN254_NATIVE
+
+    points = [Point.rand() for _ in range(8)] + [Point.ZERO()]
+    points.append(-points[0])
+    for p0 in points:
+        compressed = p0.to_compressed()
+        assert len(compressed) == CURVE.compressed_point_size()
+        assert Point.from_compressed(compressed) == p0
+        # both backends share the encoding
+        p1 = Point(BN254_NATIVE, BN254_NATIVE.from_compressed(compressed))
+        assert p1.to_compressed() == compressed
+        assert p1.to_uncompressed() == p0.to_uncompressed() or p0 == Point.ZERO()
+    assert Point.from_compressed_batch(b"".join(p.to_compressed() for p in points)) == points
+
+    # `x = 0` gives `y^2 = 3` which is not a square
+    with pytest.raises(AssertionError):
+        Point.from_compressed(bytes(32))
+
+
+def test_compressed_transcript():
+
+    def new_hasher():
+        return SHA256(person, scalar_prefix, challenge_prefix, point_prefix, compressed=True)
+
+    points = [Point.rand() for _ in range(3)]
+    s0 = Scalar.rand()
+
+    t = TranscriptWrite(new_hasher())
+    t.write_point(points[0])
+    t.write_scalar(s0)
+    t.write_point(points[1])
+    t.write_point(points[2])
+    ch = t.challenge()
+    message = t.get_message()
+    assert len(message) == 3 * CURVE.compressed_point_size() + CURVE.scalar_size()
+
+    t = TranscriptRead(new_hasher(), message)
+    assert t.read_point() == points[0]
+    assert t.read_scalar() == s0
+    assert t.read_points(2) == points[1:]
+    assert t.challenge() == ch
+
+    # challenges depend on the point format
+    t = TranscriptWrite(hasher())
+    t.write_point(points[0])
+    t.write_scalar(s0)
+    t.write_point(points[1])
+    t.write_point(points[2])
+    assert t.challenge() != ch
+
+
+def test_write_points():
+    from polynom.ecc.bn254.native import BN254_NATIVE
+
+    points = [Point.rand() for _ in range(5)] + [Point.ZERO()]
+    points.insert(2, points[0] + points[1])
+    normalized = Point.normalize_batch(points)
+    assert normalized == points
+    assert all(point.point[2] == 1 for point in normalized if point != Point.ZERO())
+
+    native = [Point(BN254_NATIVE, BN254_NATIVE.g1) * Scalar.rand() for _ in range(4)]
+    assert [point.to_uncompressed() for point in Point.normalize_batch(native)] == [point.to_uncompressed() for point in native]
+
+    for compressed in [False, True]:
+        h = SHA256(person, scalar_prefix, challenge_prefix, point_prefix, compressed)
+        t0, t1 = TranscriptWrite(h), TranscriptWrite(SHA256(person, scalar_prefix, challenge_prefix, point_prefix, compressed))
+        for point in points:
+            t0.write_point(point)
+        t1.write_points(points)
+        assert t0.get_message() == t1.get_message()
+        assert t0.challenge() == t1.challenge()
+
+
+def test_hasher_point_format():
+
+    class Plain(Hasher):
+
+        def __init__(self):
+            pass
+
+    P = Point.rand()
+    for h in [Plain(), Keccak256(person, scalar_prefix, challenge_prefix, point_prefix)]:
+        assert h.point_size() == CURVE.uncompressed_point_size()
+        assert h.decode_point(h.encode_point(P)) == P
+    h = Keccak256(person, scalar_prefix, challenge_prefix, point_prefix, compressed=True)
+    assert h.decode_points(h.encode_point(P) * 2) == [P, P]